@@ -1,15 +1,51 @@
 """Interface Streamlit moderne pour Scrapinium."""
 
 import streamlit as st
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+import functools
+import gzip
 import json
 import time
 import io
+import threading
 from datetime import datetime
-from typing import Dict, Any
+from collections import ChainMap
+from typing import Dict, Any, Optional, Union
+from urllib.parse import urlsplit
 import asyncio
+import concurrent.futures
 from src.scrapinium.ml import MLPipeline
 
+# Encodeur/décodeur JSON natif (repli sur json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: bytes) -> Any:
+    """Décode du JSON UTF-8, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> Union[bytes, str]:
+    """Sérialise en JSON compact, via orjson (bytes UTF-8) si disponible."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Cas non gérés par orjson (ex: entiers > 64 bits)
+    buffer = io.StringIO()
+    json.dump(obj, buffer, ensure_ascii=False, separators=(',', ':'))
+    return buffer.getvalue()
+
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 
@@ -27,8 +63,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS personnalisé pour le thème sombre
-st.markdown("""
+# CSS personnalisé pour le thème sombre (constante : construite une seule fois)
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -56,22 +92,41 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Session HTTP partagée (keep-alive) entre les appels et les reruns.
+    
+    Streamlit réexécute le script à chaque interaction : une session créée
+    au niveau module serait recréée (et ses connexions perdues) à chaque fois.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 def call_api(endpoint: str, method: str = "GET", data: Dict[str, Any] = None) -> Dict[str, Any]:
     """Appelle l'API Scrapinium."""
     try:
         url = f"{API_BASE_URL}{endpoint}"
+        session = get_http_session()
         
         if method == "GET":
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
         elif method == "POST":
-            response = requests.post(url, json=data, timeout=30)
+            response = session.post(url, json=data, timeout=30)
         else:
             return {"error": f"Méthode {method} non supportée"}
         
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         else:
             return {"error": f"Erreur {response.status_code}: {response.text}"}
             
@@ -79,25 +134,159 @@ def call_api(endpoint: str, method: str = "GET", data: Dict[str, Any] = None) ->
         return {"error": f"Erreur de connexion: {str(e)}"}
 
 
+# GET idempotents mis en cache : les clics répétés ne sollicitent pas l'API
+@st.cache_data(ttl=5, max_entries=32)
+def get_health() -> Dict[str, Any]:
+    """État de santé de l'API (cache 5s)."""
+    return call_api("/health")
+
+
+@st.cache_data(ttl=10, max_entries=32)
+def get_stats() -> Dict[str, Any]:
+    """Statistiques de l'API (cache 10s)."""
+    return call_api("/stats")
+
+
+@st.cache_data(ttl=2, max_entries=32)
+def get_live_metrics() -> Dict[str, Any]:
+    """Métriques temps réel (cache 2s)."""
+    return call_api("/performance/metrics/live")
+
+
+def _result_pending(result: Dict[str, Any]) -> bool:
+    """Vrai si la tâche n'est pas encore terminée (l'API répond 404 tant qu'elle tourne)."""
+    if 'error' in result:
+        return result['error'].startswith("Erreur 404")
+    return result.get('data', {}).get('status') == 'pending'
+
+
+def _unknown_task(status: Dict[str, Any], task_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Erreur à retourner si la route de statut ne connaît pas la tâche.
+    
+    Le 404 de `/result` ne distingue pas « en cours » de « inconnue ou
+    évincée » : seule la route de statut (`/scrape/{id}`) le peut.
+    """
+    if status.get('error', '').startswith("Erreur 404"):
+        return {"error": f"Tâche {task_id} introuvable (inconnue ou expirée)"}
+    return None
+
+
+# Attente d'un résultat : première sonde à 100ms, puis délai croissant plafonné
+POLL_FIRST_DELAY = 0.1
+POLL_BACKOFF = 1.6
+POLL_MAX_DELAY = 2.0
+
+
+def wait_for_result(task_id: str, max_wait: float = 30.0) -> Dict[str, Any]:
+    """
+    Attend le résultat d'une tâche par interrogations rapprochées.
+    
+    Première sonde après 100ms puis délai croissant (x1.6, plafonné à 2s) :
+    une tâche rapide est affichée dès qu'elle est terminée, avec la durée
+    d'attente effective. Une tâche inconnue de l'API arrête l'attente
+    immédiatement.
+    """
+    start = time.monotonic()
+    deadline = start + max_wait
+    delay = POLL_FIRST_DELAY
+    status_checked = False
+    progress = st.progress(0.0, text="⏳ En attente du résultat...")
+    try:
+        while True:
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            result = call_api(f"/scrape/{task_id}/result")
+            remaining = deadline - time.monotonic()
+            if not _result_pending(result) or remaining <= 0:
+                break
+            if not status_checked:
+                status_checked = True
+                unknown = _unknown_task(call_api(f"/scrape/{task_id}"), task_id)
+                if unknown:
+                    result = unknown
+                    break
+            progress.progress(min(1.0, 1 - remaining / max_wait))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+    finally:
+        progress.empty()
+    
+    if 'error' not in result:
+        st.caption(f"Terminé en {time.monotonic() - start:.1f}s")
+    return result
+
+
+def _preview(text: str, limit: int) -> str:
+    """Aperçu tronqué : seul ce préfixe transite vers le navigateur à chaque rerun."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Nombre d'aperçus conservés dans la session (les plus anciens sont oubliés)
+MAX_SESSION_PREVIEWS = 32
+
+
+def _session_preview(key: str, text: str, limit: int) -> str:
+    """Aperçu calculé une seule fois par tâche puis relu depuis st.session_state."""
+    previews = st.session_state.setdefault('previews', {})
+    preview = previews.get(key)
+    if preview is None:
+        preview = previews[key] = _preview(text, limit)
+        while len(previews) > MAX_SESSION_PREVIEWS:
+            previews.pop(next(iter(previews)))
+    return preview
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Boucle asyncio unique, tournant en continu dans un thread dédié.
+    
+    Créée une fois et partagée par toutes les sessions : leurs coroutines
+    s'y exécutent de façon concurrente au lieu de se succéder.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="streamlit-asyncio", daemon=True).start()
+    return loop
+
+
+# Attente maximale d'une coroutine par le thread du script (secondes)
+RUN_ASYNC_TIMEOUT = 60.0
+
+
+def run_async(coro, timeout: float = RUN_ASYNC_TIMEOUT):
+    """
+    Soumet une coroutine à la boucle partagée et attend son résultat.
+    
+    Au-delà de `timeout`, la coroutine est annulée et TimeoutError est levée :
+    le thread du script n'est jamais bloqué indéfiniment.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Opération interrompue après {timeout:.0f}s") from None
+
+
 def analyze_content_with_ml(html_content: str, url: str, headers: Dict[str, str] = None) -> Dict[str, Any]:
     """Analyse le contenu avec le pipeline ML."""
+    # Ressources résolues dans le thread du script (ScriptRunContext requis par st.cache_resource)
+    ml_pipeline = get_ml_pipeline()
+    try:
+        return run_async(analyze_content_async(ml_pipeline, html_content, url, headers))
+    except TimeoutError as e:
+        return {'success': False, 'error': str(e)}
+
+
+async def analyze_content_async(
+    ml_pipeline: MLPipeline, html_content: str, url: str, headers: Dict[str, str] = None
+) -> Dict[str, Any]:
+    """Analyse le contenu avec le pipeline ML (version coroutine)."""
     try:
-        ml_pipeline = get_ml_pipeline()
-        
-        # Créer un event loop si nécessaire
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
         # Analyser le contenu
-        result = loop.run_until_complete(
-            ml_pipeline.analyze_page(
-                html=html_content,
-                url=url,
-                headers=headers or {}
-            )
+        result = await ml_pipeline.analyze_page(
+            html=html_content,
+            url=url,
+            headers=headers or {}
         )
         
         return {
@@ -124,62 +313,134 @@ def analyze_content_with_ml(html_content: str, url: str, headers: Dict[str, str]
             'error': str(e)
         }
 
-def create_download_files(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Crée les fichiers de téléchargement dans différents formats."""
-    content = data.get('content', '')
-    url = data.get('url', 'unknown')
-    metadata = data.get('metadata', {})
+
+async def _api_json(session: aiohttp.ClientSession, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    """Équivalent asynchrone de call_api (mêmes formats de réponse et d'erreur)."""
+    try:
+        async with session.request(method, endpoint, **kwargs) as response:
+            body = await response.read()
+            if response.status == 200:
+                return _loads(body)
+            return {"error": f"Erreur {response.status}: {body.decode('utf-8', 'replace')}"}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {"error": f"Erreur de connexion: {str(e)}"}
+
+
+@st.cache_resource(show_spinner=False)
+def _aio_session_holder() -> Dict[str, aiohttp.ClientSession]:
+    """Conteneur persistant de la session aiohttp (créée sur la boucle partagée)."""
+    return {}
+
+
+async def get_aio_session(holder: Dict[str, aiohttp.ClientSession]) -> aiohttp.ClientSession:
+    """
+    Session aiohttp partagée (pool keep-alive) pour les appels asynchrones.
     
-    # Nettoyer le nom de fichier
-    filename_base = url.replace('https://', '').replace('http://', '').replace('/', '_').replace('?', '_')[:50]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    Une session est liée à la boucle qui l'a créée : elle est donc créée
+    paresseusement depuis une coroutine exécutée par `run_async` (toujours
+    dans le thread de la boucle partagée), puis conservée entre les reruns
+    dans `holder` (obtenu via `_aio_session_holder()` dans le thread du script).
+    """
+    session = holder.get('session')
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=20, keepalive_timeout=30)
+        session = aiohttp.ClientSession(
+            base_url=API_BASE_URL,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        holder['session'] = session
+    return session
+
+
+async def _scrape_and_analyze(
+    url: str,
+    ml_pipeline: MLPipeline,
+    session_holder: Dict[str, aiohttp.ClientSession],
+    max_wait: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Lance le scraping d'une URL, attend son résultat puis l'analyse avec le pipeline ML.
+    
+    Tout s'exécute sur la boucle partagée (voir `get_event_loop`) : pendant
+    l'attente du résultat (`asyncio.sleep`), la boucle exécute les coroutines
+    des autres sessions ; seul le thread du script appelant attend dans
+    `run_async`. L'analyse est attendue directement une fois le HTML reçu,
+    et les requêtes réutilisent la session aiohttp partagée (jamais fermée).
+    
+    `ml_pipeline` et `session_holder` sont des ressources `st.cache_resource` :
+    l'appelant les résout dans le thread du script, le seul à disposer d'un
+    ScriptRunContext, avant de soumettre la coroutine.
+    """
+    session = await get_aio_session(session_holder)
+    scrape_result = await _api_json(session, "POST", "/scrape", json={
+        "url": url,
+        "task_type": "full_page",
+        "priority": "high"
+    })
+    if 'error' in scrape_result:
+        return {'success': False, 'error': scrape_result['error']}
+    
+    task_id = scrape_result.get('data', {}).get('task_id')
+    if not task_id:
+        return {'success': False, 'error': "Task ID non trouvé"}
+    
+    # Attendre le résultat (même backoff que wait_for_result)
+    deadline = time.monotonic() + max_wait
+    delay = POLL_FIRST_DELAY
+    status_checked = False
+    while True:
+        await asyncio.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        result_data = await _api_json(session, "GET", f"/scrape/{task_id}/result")
+        remaining = deadline - time.monotonic()
+        if not _result_pending(result_data) or remaining <= 0:
+            break
+        if not status_checked:
+            status_checked = True
+            status = await _api_json(session, "GET", f"/scrape/{task_id}")
+            unknown = _unknown_task(status, task_id)
+            if unknown:
+                result_data = unknown
+                break
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
     
-    downloads = {}
+    if 'error' in result_data:
+        return {'success': False, 'error': result_data['error']}
     
-    # 1. Fichier texte brut
-    txt_content = f"""SCRAPINIUM - Résultat d'extraction
+    html_content = result_data.get('data', {}).get('html', '')
+    if not html_content:
+        return {'success': False, 'error': "Contenu HTML non disponible"}
+    
+    ml_analysis = await analyze_content_async(ml_pipeline, html_content, url)
+    if not ml_analysis['success']:
+        ml_analysis['error'] = f"Erreur ML: {ml_analysis['error']}"
+    return ml_analysis
+
+# Caractères d'URL remplacés dans les noms de fichiers (table C, une seule passe)
+_FN_TRANS = str.maketrans({'/': '_', '?': '_', ':': '_', '&': '_', '=': '_'})
+
+# Gabarits des exports texte (remplis via format_map)
+_TXT_TMPL = """SCRAPINIUM - Résultat d'extraction
 =====================================
 
 URL: {url}
-Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Format: {data.get('output_format', 'text')}
-Mots: {metadata.get('word_count', 'N/A')}
-Taille: {metadata.get('content_size', 'N/A')} bytes
+Date: {human}
+Format: {output_format}
+Mots: {word_count}
+Taille: {content_size} bytes
 
 CONTENU:
 --------
 {content}
 """
-    downloads['txt'] = {
-        'content': txt_content,
-        'filename': f"scrapinium_{filename_base}_{timestamp}.txt",
-        'mime': 'text/plain'
-    }
-    
-    # 2. Fichier JSON structuré
-    json_content = {
-        "scrapinium_export": {
-            "url": url,
-            "timestamp": datetime.now().isoformat(),
-            "format": data.get('output_format', 'text'),
-            "metadata": metadata,
-            "content": content
-        }
-    }
-    downloads['json'] = {
-        'content': json.dumps(json_content, indent=2, ensure_ascii=False),
-        'filename': f"scrapinium_{filename_base}_{timestamp}.json",
-        'mime': 'application/json'
-    }
-    
-    # 3. Fichier Markdown
-    md_content = f"""# Scrapinium - Extraction de {url}
+
+_MD_TMPL = """# Scrapinium - Extraction de {url}
 
 **URL:** {url}  
-**Date:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  
-**Format:** {data.get('output_format', 'text')}  
-**Mots:** {metadata.get('word_count', 'N/A')}  
-**Taille:** {metadata.get('content_size', 'N/A')} bytes  
+**Date:** {human}  
+**Format:** {output_format}  
+**Mots:** {word_count}  
+**Taille:** {content_size} bytes  
 
 ---
 
@@ -191,71 +452,289 @@ CONTENU:
 
 *Généré par Scrapinium - Web Scraping Intelligent*
 """
-    downloads['md'] = {
-        'content': md_content,
-        'filename': f"scrapinium_{filename_base}_{timestamp}.md",
-        'mime': 'text/markdown'
-    }
+
+# Valeurs affichées quand les métadonnées ne fournissent pas le champ
+_FIELD_DEFAULTS = {'word_count': 'N/A', 'content_size': 'N/A'}
+
+# Formats de téléchargement : (clé, libellé du bouton, type MIME)
+_FORMATS = [
+    ("txt", "📄 TXT", "text/plain"),
+    ("json", "📊 JSON", "application/json"),
+    ("md", "📝 MD", "text/markdown"),
+    ("csv", "📋 CSV", "application/gzip"),
+]
+
+
+def _template_fields(url: str, content: str, metadata: Dict[str, Any],
+                     output_format: str, human: str) -> ChainMap:
+    """Champs des gabarits : valeurs calculées, puis métadonnées, puis défauts."""
+    return ChainMap(
+        {'url': url, 'human': human, 'output_format': output_format, 'content': content},
+        metadata,
+        _FIELD_DEFAULTS,
+    )
+
+
+# Rendus des exports : appelés au clic seulement, puis mémoïsés (cache borné)
+# pour que les clics répétés sur un même résultat ne recalculent rien.
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_txt(url: str, content: str, metadata: Dict[str, Any],
+                output_format: str, human: str) -> str:
+    """Fichier texte brut."""
+    return _TXT_TMPL.format_map(_template_fields(url, content, metadata, output_format, human))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_json(url: str, content: str, metadata: Dict[str, Any],
+                 output_format: str, iso: str) -> Union[bytes, str]:
+    """Fichier JSON structuré, compact (~30% d'octets en moins à transmettre)."""
+    return _dumps({
+        "scrapinium_export": {
+            "url": url,
+            "timestamp": iso,
+            "format": output_format,
+            "metadata": metadata,
+            "content": content
+        }
+    })
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_md(url: str, content: str, metadata: Dict[str, Any],
+               output_format: str, human: str) -> str:
+    """Fichier Markdown."""
+    return _MD_TMPL.format_map(_template_fields(url, content, metadata, output_format, human))
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_csv(url: str, content: str, metadata: Dict[str, Any],
+                output_format: str, human: str) -> bytes:
+    """Fichier CSV gzippé (pour les données structurées)."""
+    fields = _template_fields(url, content, metadata, output_format, human)
+    # Le module csv (en C) échappe les guillemets à l'écriture, sans copie du
+    # contenu ; le texte est gzippé au fil de l'eau (niveau 1 : débit maximal)
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=1) as gz:
+        text = io.TextIOWrapper(gz, encoding='utf-8', newline='', write_through=True)
+        text.write("URL,Date,Format,Mots,Taille,Contenu\n")
+        writer = csv.writer(text, quoting=csv.QUOTE_ALL, lineterminator="\n")
+        writer.writerow([
+            url, human, output_format, fields['word_count'], fields['content_size'], content
+        ])
+        text.flush()
+        text.detach()
+    return buffer.getvalue()
+
+
+def create_download_files(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prépare les fichiers de téléchargement dans différents formats.
     
-    # 4. Fichier CSV (pour les données structurées)
-    csv_content = f"""URL,Date,Format,Mots,Taille,Contenu
-"{url}","{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}","{data.get('output_format', 'text')}","{metadata.get('word_count', 'N/A')}","{metadata.get('content_size', 'N/A')}","{content.replace('"', '""')}"
-"""
-    downloads['csv'] = {
-        'content': csv_content,
-        'filename': f"scrapinium_{filename_base}_{timestamp}.csv",
-        'mime': 'text/csv'
+    Chaque format expose un `builder` sans argument (`functools.partial`
+    d'un rendu mémoïsé), passé tel quel à `st.download_button` : aucun
+    export n'est construit au rerun, seulement au clic, et la mémoire de
+    la page ne croît pas avec la taille de l'historique. Cette préparation
+    est triviale et volontairement non mise en cache : la date et
+    l'horodatage du nom de fichier sont ceux de l'affichage courant.
+    """
+    content = data.get('content', '')
+    url = data.get('url', 'unknown')
+    metadata = data.get('metadata', {})
+    output_format = data.get('output_format', 'text')
+    
+    # Nettoyer le nom de fichier
+    parsed = urlsplit(url)
+    filename_base = (parsed.netloc + parsed.path).translate(_FN_TRANS)[:50]
+    
+    # Une seule lecture de l'horloge, formats réutilisés par tous les fichiers
+    now = datetime.now()
+    human = now.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    
+    def download(render, stamp: str, extension: str) -> Dict[str, Any]:
+        return {
+            'builder': functools.partial(render, url, content, metadata, output_format, stamp),
+            'filename': f"scrapinium_{filename_base}_{timestamp}.{extension}",
+        }
+    
+    return {
+        'txt': download(_render_txt, human, "txt"),
+        'json': download(_render_json, now.isoformat(), "json"),
+        'md': download(_render_md, human, "md"),
+        'csv': download(_render_csv, human, "csv.gz"),
     }
+
+def render_download_buttons(downloads: Dict[str, Any], key_suffix: str = "") -> None:
+    """
+    Affiche un bouton de téléchargement par format, sur une ligne.
     
-    return downloads
+    Seul le format cliqué est construit (builder appelé au clic), et le
+    clic ne relance pas le script : le résultat affiché reste en place.
+    Nécessite Streamlit >= 1.52 (`data` appelable) ; voir le README.
+    """
+    for column, (fmt, label, mime) in zip(st.columns(len(_FORMATS)), _FORMATS):
+        with column:
+            st.download_button(
+                label,
+                data=downloads[fmt]['builder'],
+                file_name=downloads[fmt]['filename'],
+                mime=mime,
+                key=f"{fmt}{key_suffix}" if key_suffix else None,
+                on_click="ignore",
+                use_container_width=True
+            )
+
+@st.fragment
+def _render_result_block(data: Dict[str, Any], key_prefix: str,
+                         preview_limit: int = 2000, height: int = 200) -> None:
+    """
+    Affiche un résultat de scraping : métadonnées, aperçu et téléchargements.
+    
+    Partagé par le panneau principal et l'historique ; `key_prefix` (unique
+    par tâche) préfixe les clés des widgets et de l'aperçu en session.
+    """
+    metadata = data.get('metadata', {})
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.write(f"**URL:** {data.get('url', 'N/A')}")
+        st.write(f"**Format:** {data.get('output_format', 'N/A')}")
+    with col_b:
+        st.write(f"**Mots:** {metadata.get('word_count', 'N/A')}")
+        st.write(f"**Taille:** {metadata.get('content_size', 'N/A')} bytes")
+    
+    content = data.get('content', '')
+    if content:
+        st.text_area(
+            "Contenu extrait:",
+            _session_preview(f"preview_{key_prefix}", content, preview_limit),
+            height=height,
+            key=f"{key_prefix}_content"
+        )
+        
+        # Boutons de téléchargement
+        st.subheader("💾 Télécharger les résultats")
+        render_download_buttons(create_download_files(data), key_suffix=f"_{key_prefix}")
+
+@st.fragment(run_every=5)
+def render_live_metrics() -> None:
+    """Métriques live : seul ce bloc est réexécuté par son minuteur."""
+    st.subheader("⚡ Métriques Live")
+    
+    # Après le premier chargement, le fragment se rafraîchit seul toutes les 5s
+    if st.button("🔄 Actualiser Métriques", use_container_width=True) or 'live_metrics' in st.session_state:
+        with st.spinner("Chargement des métriques..."):
+            metrics = get_live_metrics()
+            st.session_state['live_metrics'] = metrics
+    
+    if 'live_metrics' in st.session_state:
+        metrics = st.session_state['live_metrics']
+        if 'error' not in metrics:
+            if 'data' in metrics:
+                data = metrics['data']
+                current = data.get('current_metrics', {})
+                
+                # Métriques système
+                col_a, col_b, col_c = st.columns(3)
+                with col_a:
+                    st.metric("💾 Mémoire (MB)", f"{current.get('memory_usage_mb', 0):.1f}")
+                with col_b:
+                    st.metric("🔄 Cache Hit Rate", f"{current.get('cache_hit_rate', 0):.1%}")
+                with col_c:
+                    st.metric("⚡ Opérations", current.get('total_operations', 0))
+        else:
+            st.error(metrics['error'])
+
+@st.fragment
+def render_history() -> None:
+    """Historique des tâches : ses boutons ne relancent pas toute la page."""
+    st.subheader("📜 Historique des Tâches")
+    
+    if 'scraping_history' in st.session_state and st.session_state['scraping_history']:
+        for i, task in enumerate(st.session_state['scraping_history']):
+            with st.expander(f"🌐 {task['url']} - {task['timestamp']}"):
+                col_x, col_y = st.columns(2)
+                with col_x:
+                    st.write(f"**Type:** {task['task_type']}")
+                    st.write(f"**Priorité:** {task['priority']}")
+                with col_y:
+                    st.write(f"**Task ID:** {task.get('task_id', 'N/A')}")
+                    st.write(f"**Message:** {task['result'].get('message', 'N/A')}")
+                
+                # Bouton pour récupérer le résultat
+                if task.get('task_id') and st.button(f"📄 Voir le résultat", key=f"result_{i}"):
+                    with st.spinner("Récupération du résultat..."):
+                        result_data = wait_for_result(task['task_id'])
+                        
+                        if 'error' not in result_data:
+                            data = result_data.get('data', {})
+                            
+                            st.success("✅ Résultat récupéré !")
+                            
+                            _render_result_block(
+                                data, f"hist_{task['task_id']}", preview_limit=1000, height=150
+                            )
+                        else:
+                            st.error(f"❌ {result_data['error']}")
+    else:
+        st.info("📝 Aucune tâche dans l'historique")
+
+@st.fragment
+def render_sidebar_stats() -> None:
+    """Statut et statistiques de la sidebar : leurs boutons ne relancent que ce bloc."""
+    st.header("📊 Statut Système")
+    
+    if st.button("🔄 Actualiser Stats", use_container_width=True):
+        with st.spinner("Chargement..."):
+            health_data = get_health()
+            st.session_state['health_data'] = health_data
+    
+    # Afficher les stats
+    if 'health_data' in st.session_state:
+        health = st.session_state['health_data']
+        if 'error' not in health:
+            st.metric("🔵 API", health.get('api', 'unknown'))
+            st.metric("🔴 Ollama", health.get('ollama', 'unknown'))
+            st.metric("🟢 Database", health.get('database', 'unknown'))
+        else:
+            st.error(health['error'])
+    
+    st.divider()
+    
+    # Stats générales
+    st.header("📈 Statistiques")
+    if st.button("📊 Charger Stats", use_container_width=True):
+        with st.spinner("Chargement..."):
+            stats_data = get_stats()
+            st.session_state['stats_data'] = stats_data
+    
+    if 'stats_data' in st.session_state:
+        stats = st.session_state['stats_data']
+        if 'error' not in stats:
+            tasks = stats.get('tasks', {})
+            browser_pool = stats.get('browser_pool', {})
+            cache = stats.get('cache', {})
+            
+            st.metric("🎯 Tâches actives", tasks.get('active', 0))
+            st.metric("🌐 Navigateurs", browser_pool.get('active_browsers', 0))
+            st.metric("💾 Cache entries", cache.get('total_entries', 0))
+        else:
+            st.error(stats['error'])
 
 def main():
     """Interface principale."""
-    
+
+    # Le CSS doit être réémis à chaque exécution : Streamlit retire de la page
+    # tout élément non redessiné. Le delta identique est réconcilié côté client.
+    st.markdown(_CSS, unsafe_allow_html=True)
+
     # Header
     st.markdown('<h1 class="main-header">🕸️ Scrapinium</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; color: #64748b; font-size: 1.2rem;">Web Scraping Intelligent avec IA</p>', unsafe_allow_html=True)
     
     # Sidebar pour les stats système
     with st.sidebar:
-        st.header("📊 Statut Système")
-        
-        if st.button("🔄 Actualiser Stats", use_container_width=True):
-            with st.spinner("Chargement..."):
-                health_data = call_api("/health")
-                st.session_state['health_data'] = health_data
-        
-        # Afficher les stats
-        if 'health_data' in st.session_state:
-            health = st.session_state['health_data']
-            if 'error' not in health:
-                st.metric("🔵 API", health.get('api', 'unknown'))
-                st.metric("🔴 Ollama", health.get('ollama', 'unknown'))
-                st.metric("🟢 Database", health.get('database', 'unknown'))
-            else:
-                st.error(health['error'])
-        
-        st.divider()
-        
-        # Stats générales
-        st.header("📈 Statistiques")
-        if st.button("📊 Charger Stats", use_container_width=True):
-            with st.spinner("Chargement..."):
-                stats_data = call_api("/stats")
-                st.session_state['stats_data'] = stats_data
-        
-        if 'stats_data' in st.session_state:
-            stats = st.session_state['stats_data']
-            if 'error' not in stats:
-                tasks = stats.get('tasks', {})
-                browser_pool = stats.get('browser_pool', {})
-                cache = stats.get('cache', {})
-                
-                st.metric("🎯 Tâches actives", tasks.get('active', 0))
-                st.metric("🌐 Navigateurs", browser_pool.get('active_browsers', 0))
-                st.metric("💾 Cache entries", cache.get('total_entries', 0))
-            else:
-                st.error(stats['error'])
+        render_sidebar_stats()
     
     # Interface principale
     col1, col2 = st.columns([1, 1])
@@ -307,80 +786,21 @@ def main():
                             if task_id:
                                 # Attendre et récupérer le résultat
                                 with st.spinner("⏳ Récupération du résultat..."):
-                                    # Attendre un peu que la tâche se termine
-                                    time.sleep(3)
-                                    
-                                    # Récupérer le résultat complet
-                                    result_data = call_api(f"/scrape/{task_id}/result")
+                                    # Récupérer le résultat complet dès que la tâche se termine
+                                    result_data = wait_for_result(task_id)
                                     
                                     if 'error' not in result_data:
                                         st.success("📋 Résultat complet récupéré !")
                                         
                                         # Afficher le résultat dans un expander
                                         with st.expander("📄 Contenu extrait", expanded=True):
-                                            data = result_data.get('data', {})
-                                            
-                                            col_a, col_b = st.columns(2)
-                                            with col_a:
-                                                st.write(f"**URL:** {data.get('url', 'N/A')}")
-                                                st.write(f"**Format:** {data.get('output_format', 'N/A')}")
-                                            with col_b:
-                                                metadata = data.get('metadata', {})
-                                                st.write(f"**Mots:** {metadata.get('word_count', 'N/A')}")
-                                                st.write(f"**Taille:** {metadata.get('content_size', 'N/A')} bytes")
-                                            
-                                            # Contenu extrait
-                                            content = data.get('content', '')
-                                            if content:
-                                                st.text_area(
-                                                    "Contenu extrait:",
-                                                    content[:2000] + "..." if len(content) > 2000 else content,
-                                                    height=200
-                                                )
-                                                
-                                                # Boutons de téléchargement
-                                                st.subheader("💾 Télécharger les résultats")
-                                                downloads = create_download_files(data)
-                                                
-                                                col_dl1, col_dl2, col_dl3, col_dl4 = st.columns(4)
-                                                
-                                                with col_dl1:
-                                                    st.download_button(
-                                                        "📄 TXT",
-                                                        data=downloads['txt']['content'],
-                                                        file_name=downloads['txt']['filename'],
-                                                        mime=downloads['txt']['mime'],
-                                                        use_container_width=True
-                                                    )
-                                                
-                                                with col_dl2:
-                                                    st.download_button(
-                                                        "📊 JSON",
-                                                        data=downloads['json']['content'],
-                                                        file_name=downloads['json']['filename'],
-                                                        mime=downloads['json']['mime'],
-                                                        use_container_width=True
-                                                    )
-                                                
-                                                with col_dl3:
-                                                    st.download_button(
-                                                        "📝 MD",
-                                                        data=downloads['md']['content'],
-                                                        file_name=downloads['md']['filename'],
-                                                        mime=downloads['md']['mime'],
-                                                        use_container_width=True
-                                                    )
-                                                
-                                                with col_dl4:
-                                                    st.download_button(
-                                                        "📋 CSV",
-                                                        data=downloads['csv']['content'],
-                                                        file_name=downloads['csv']['filename'],
-                                                        mime=downloads['csv']['mime'],
-                                                        use_container_width=True
-                                                    )
+                                            _render_result_block(
+                                                result_data.get('data', {}), f"main_{task_id}"
+                                            )
+                                    elif _result_pending(result_data):
+                                        st.warning("⏳ Tâche en cours... Réessayez dans quelques secondes")
                                     else:
-                                        st.warning(f"⏳ Tâche en cours... Réessayez dans quelques secondes")
+                                        st.error(f"❌ {result_data['error']}")
                             
                             # Ajouter à l'historique
                             if 'scraping_history' not in st.session_state:
@@ -408,119 +828,10 @@ def main():
         tab1, tab2, tab3 = st.tabs(["📊 Dashboard", "📜 Historique", "🤖 Analyse ML"])
         
         with tab1:
-            st.subheader("⚡ Métriques Live")
-            
-            if st.button("🔄 Actualiser Métriques", use_container_width=True):
-                with st.spinner("Chargement des métriques..."):
-                    metrics = call_api("/performance/metrics/live")
-                    st.session_state['live_metrics'] = metrics
-            
-            if 'live_metrics' in st.session_state:
-                metrics = st.session_state['live_metrics']
-                if 'error' not in metrics:
-                    if 'data' in metrics:
-                        data = metrics['data']
-                        current = data.get('current_metrics', {})
-                        
-                        # Métriques système
-                        col_a, col_b, col_c = st.columns(3)
-                        with col_a:
-                            st.metric("💾 Mémoire (MB)", f"{current.get('memory_usage_mb', 0):.1f}")
-                        with col_b:
-                            st.metric("🔄 Cache Hit Rate", f"{current.get('cache_hit_rate', 0):.1%}")
-                        with col_c:
-                            st.metric("⚡ Opérations", current.get('total_operations', 0))
-                else:
-                    st.error(metrics['error'])
+            render_live_metrics()
         
         with tab2:
-            st.subheader("📜 Historique des Tâches")
-            
-            if 'scraping_history' in st.session_state and st.session_state['scraping_history']:
-                for i, task in enumerate(st.session_state['scraping_history']):
-                    with st.expander(f"🌐 {task['url']} - {task['timestamp']}"):
-                        col_x, col_y = st.columns(2)
-                        with col_x:
-                            st.write(f"**Type:** {task['task_type']}")
-                            st.write(f"**Priorité:** {task['priority']}")
-                        with col_y:
-                            st.write(f"**Task ID:** {task.get('task_id', 'N/A')}")
-                            st.write(f"**Message:** {task['result'].get('message', 'N/A')}")
-                        
-                        # Bouton pour récupérer le résultat
-                        if task.get('task_id') and st.button(f"📄 Voir le résultat", key=f"result_{i}"):
-                            with st.spinner("Récupération du résultat..."):
-                                result_data = call_api(f"/scrape/{task['task_id']}/result")
-                                
-                                if 'error' not in result_data:
-                                    data = result_data.get('data', {})
-                                    
-                                    st.success("✅ Résultat récupéré !")
-                                    
-                                    col_a, col_b = st.columns(2)
-                                    with col_a:
-                                        st.write(f"**Format:** {data.get('output_format', 'N/A')}")
-                                    with col_b:
-                                        metadata = data.get('metadata', {})
-                                        st.write(f"**Mots:** {metadata.get('word_count', 'N/A')}")
-                                    
-                                    content = data.get('content', '')
-                                    if content:
-                                        st.text_area(
-                                            "Contenu:",
-                                            content[:1000] + "..." if len(content) > 1000 else content,
-                                            height=150,
-                                            key=f"content_{i}"
-                                        )
-                                        
-                                        # Boutons de téléchargement pour l'historique
-                                        downloads = create_download_files(data)
-                                        
-                                        col_h1, col_h2, col_h3, col_h4 = st.columns(4)
-                                        
-                                        with col_h1:
-                                            st.download_button(
-                                                "📄 TXT",
-                                                data=downloads['txt']['content'],
-                                                file_name=downloads['txt']['filename'],
-                                                mime=downloads['txt']['mime'],
-                                                key=f"txt_{i}",
-                                                use_container_width=True
-                                            )
-                                        
-                                        with col_h2:
-                                            st.download_button(
-                                                "📊 JSON",
-                                                data=downloads['json']['content'],
-                                                file_name=downloads['json']['filename'],
-                                                mime=downloads['json']['mime'],
-                                                key=f"json_{i}",
-                                                use_container_width=True
-                                            )
-                                        
-                                        with col_h3:
-                                            st.download_button(
-                                                "📝 MD",
-                                                data=downloads['md']['content'],
-                                                file_name=downloads['md']['filename'],
-                                                mime=downloads['md']['mime'],
-                                                key=f"md_{i}",
-                                                use_container_width=True
-                                            )
-                                        
-                                        with col_h4:
-                                            st.download_button(
-                                                "📋 CSV",
-                                                data=downloads['csv']['content'],
-                                                file_name=downloads['csv']['filename'],
-                                                mime=downloads['csv']['mime'],
-                                                key=f"csv_{i}",
-                                                use_container_width=True
-                                            )
-                                else:
-                                    st.error(f"❌ {result_data['error']}")
-            else:
-                st.info("📝 Aucune tâche dans l'historique")
+            render_history()
         
         with tab3:
             st.subheader("🤖 Analyse ML de Contenu")
@@ -543,116 +854,90 @@ def main():
                 
                 if analyze_button and analysis_url:
                     with st.spinner("🤖 Analyse ML en cours..."):
-                        # Récupérer le contenu de la page
-                        scrape_result = call_api("/scrape", "POST", {
-                            "url": analysis_url,
-                            "task_type": "full_page",
-                            "priority": "high"
-                        })
+                        # Scraping, attente du résultat et analyse ML sur la boucle partagée
+                        try:
+                            ml_analysis = run_async(_scrape_and_analyze(
+                                analysis_url, get_ml_pipeline(), _aio_session_holder()
+                            ))
+                        except TimeoutError as e:
+                            ml_analysis = {'success': False, 'error': str(e)}
                         
-                        if 'error' not in scrape_result:
-                            task_id = scrape_result.get('data', {}).get('task_id')
+                        if ml_analysis['success']:
+                            analysis = ml_analysis['analysis']
                             
-                            if task_id:
-                                # Attendre le résultat
-                                time.sleep(3)
-                                result_data = call_api(f"/scrape/{task_id}/result")
-                                
-                                if 'error' not in result_data:
-                                    # Analyser avec ML
-                                    page_data = result_data.get('data', {})
-                                    html_content = page_data.get('html', '')
+                            st.success("✅ Analyse ML terminée !")
+                            
+                            # Affichage des résultats
+                            col_ml1, col_ml2, col_ml3 = st.columns(3)
+                            
+                            with col_ml1:
+                                st.metric(
+                                    "🏷️ Type de page", 
+                                    analysis['page_type'].title(),
+                                    f"Confiance: {analysis['confidence']:.1%}"
+                                )
+                            
+                            with col_ml2:
+                                st.metric(
+                                    "⭐ Qualité",
+                                    analysis['quality'].title(),
+                                    f"Score: {analysis['readability_score']:.0f}/100"
+                                )
+                            
+                            with col_ml3:
+                                st.metric(
+                                    "🌍 Langue",
+                                    analysis['language'].upper(),
+                                    f"{analysis['word_count']} mots"
+                                )
+                            
+                            # Détails de l'analyse
+                            if enable_classification:
+                                with st.expander("🏷️ Classification détaillée", expanded=True):
+                                    col_c1, col_c2 = st.columns(2)
                                     
-                                    if html_content:
-                                        ml_analysis = analyze_content_with_ml(
-                                            html_content=html_content,
-                                            url=analysis_url
-                                        )
-                                        
-                                        if ml_analysis['success']:
-                                            analysis = ml_analysis['analysis']
-                                            
-                                            st.success("✅ Analyse ML terminée !")
-                                            
-                                            # Affichage des résultats
-                                            col_ml1, col_ml2, col_ml3 = st.columns(3)
-                                            
-                                            with col_ml1:
-                                                st.metric(
-                                                    "🏷️ Type de page", 
-                                                    analysis['page_type'].title(),
-                                                    f"Confiance: {analysis['confidence']:.1%}"
-                                                )
-                                            
-                                            with col_ml2:
-                                                st.metric(
-                                                    "⭐ Qualité",
-                                                    analysis['quality'].title(),
-                                                    f"Score: {analysis['readability_score']:.0f}/100"
-                                                )
-                                            
-                                            with col_ml3:
-                                                st.metric(
-                                                    "🌍 Langue",
-                                                    analysis['language'].upper(),
-                                                    f"{analysis['word_count']} mots"
-                                                )
-                                            
-                                            # Détails de l'analyse
-                                            if enable_classification:
-                                                with st.expander("🏷️ Classification détaillée", expanded=True):
-                                                    col_c1, col_c2 = st.columns(2)
-                                                    
-                                                    with col_c1:
-                                                        st.write(f"**Type détecté:** {analysis['page_type']}")
-                                                        st.write(f"**Confiance:** {analysis['confidence']:.1%}")
-                                                        st.write(f"**Qualité:** {analysis['quality']}")
-                                                        st.write(f"**Langue:** {analysis['language']}")
-                                                    
-                                                    with col_c2:
-                                                        st.write(f"**Lisibilité:** {analysis['readability_score']:.0f}/100")
-                                                        st.write(f"**Complétude:** {analysis['completeness_score']:.0f}/100")
-                                                        st.write(f"**Confiance globale:** {analysis['global_confidence']:.1%}")
-                                                        st.write(f"**Temps d'analyse:** {analysis['processing_time']:.2f}s")
-                                            
-                                            if enable_bot_detection and analysis['bot_challenges']:
-                                                with st.expander("🛡️ Détection anti-bot", expanded=True):
-                                                    st.warning(f"⚠️ {len(analysis['bot_challenges'])} défi(s) anti-bot détecté(s)")
-                                                    
-                                                    for challenge in analysis['bot_challenges']:
-                                                        st.write(f"• {challenge.replace('_', ' ').title()}")
-                                            
-                                            if enable_content_analysis:
-                                                with st.expander("📊 Analyse de contenu", expanded=True):
-                                                    
-                                                    # Sujets détectés
-                                                    if analysis['topics']:
-                                                        st.write("**🎯 Sujets identifiés:**")
-                                                        for topic in analysis['topics']:
-                                                            st.write(f"• {topic.title()}")
-                                                    
-                                                    # Mots-clés principaux
-                                                    if analysis['top_keywords']:
-                                                        st.write("**🔑 Mots-clés principaux:**")
-                                                        keywords_text = ", ".join([f"{kw[0]} ({kw[1]})" for kw in analysis['top_keywords']])
-                                                        st.write(keywords_text)
-                                            
-                                            # Recommandations
-                                            if analysis['recommendations']:
-                                                with st.expander("💡 Recommandations", expanded=True):
-                                                    for rec in analysis['recommendations']:
-                                                        st.write(f"• {rec}")
-                                        
-                                        else:
-                                            st.error(f"❌ Erreur ML: {ml_analysis['error']}")
-                                    else:
-                                        st.error("❌ Contenu HTML non disponible")
-                                else:
-                                    st.error(f"❌ {result_data['error']}")
-                            else:
-                                st.error("❌ Task ID non trouvé")
+                                    with col_c1:
+                                        st.write(f"**Type détecté:** {analysis['page_type']}")
+                                        st.write(f"**Confiance:** {analysis['confidence']:.1%}")
+                                        st.write(f"**Qualité:** {analysis['quality']}")
+                                        st.write(f"**Langue:** {analysis['language']}")
+                                    
+                                    with col_c2:
+                                        st.write(f"**Lisibilité:** {analysis['readability_score']:.0f}/100")
+                                        st.write(f"**Complétude:** {analysis['completeness_score']:.0f}/100")
+                                        st.write(f"**Confiance globale:** {analysis['global_confidence']:.1%}")
+                                        st.write(f"**Temps d'analyse:** {analysis['processing_time']:.2f}s")
+                            
+                            if enable_bot_detection and analysis['bot_challenges']:
+                                with st.expander("🛡️ Détection anti-bot", expanded=True):
+                                    st.warning(f"⚠️ {len(analysis['bot_challenges'])} défi(s) anti-bot détecté(s)")
+                                    
+                                    for challenge in analysis['bot_challenges']:
+                                        st.write(f"• {challenge.replace('_', ' ').title()}")
+                            
+                            if enable_content_analysis:
+                                with st.expander("📊 Analyse de contenu", expanded=True):
+                                    
+                                    # Sujets détectés
+                                    if analysis['topics']:
+                                        st.write("**🎯 Sujets identifiés:**")
+                                        for topic in analysis['topics']:
+                                            st.write(f"• {topic.title()}")
+                                    
+                                    # Mots-clés principaux
+                                    if analysis['top_keywords']:
+                                        st.write("**🔑 Mots-clés principaux:**")
+                                        keywords_text = ", ".join([f"{kw[0]} ({kw[1]})" for kw in analysis['top_keywords']])
+                                        st.write(keywords_text)
+                            
+                            # Recommandations
+                            if analysis['recommendations']:
+                                with st.expander("💡 Recommandations", expanded=True):
+                                    for rec in analysis['recommendations']:
+                                        st.write(f"• {rec}")
+                        
                         else:
-                            st.error(f"❌ {scrape_result['error']}")
+                            st.error(f"❌ {ml_analysis['error']}")
             
             st.divider()
             
@@ -751,14 +1036,7 @@ def main():
                     </html>
                     """
                     
-                    # Créer un event loop si nécessaire
-                    try:
-                        loop = asyncio.get_event_loop()
-                    except RuntimeError:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                    
-                    result = loop.run_until_complete(
+                    result = run_async(
                         ml_pipeline.analyze_page(
                             html=test_html,
                             url="https://test.example.com",
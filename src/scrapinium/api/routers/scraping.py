@@ -83,10 +83,7 @@ async def get_task_status(task_id: str):
         )
 
     # Chercher dans les tâches terminées
-    completed_tasks_list = task_manager.get_completed_tasks()
-    completed_task = next(
-        (task for task in completed_tasks_list if task["id"] == task_id), None
-    )
+    completed_task = task_manager.find_completed_task(task_id)
 
     if completed_task:
         return APIResponse.success_response(
@@ -104,10 +101,7 @@ async def get_task_result(task_id: str):
     """Récupère le résultat d'une tâche terminée."""
     # Chercher dans les tâches terminées
     task_manager = get_task_manager()
-    completed_tasks_list = task_manager.get_completed_tasks()
-    completed_task = next(
-        (task for task in completed_tasks_list if task["id"] == task_id), None
-    )
+    completed_task = task_manager.find_completed_task(task_id)
 
     if not completed_task:
         raise HTTPException(
@@ -120,6 +114,7 @@ async def get_task_result(task_id: str):
             detail=f"Tâche {task_id} n'est pas terminée (statut: {completed_task['status']})",
         )
 
+    task_manager.mark_result_read(task_id)
     return APIResponse.success_response(
         data={
             "task_id": task_id,
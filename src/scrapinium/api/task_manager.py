@@ -4,6 +4,7 @@ import asyncio
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 import threading
+from ..utils.cleanup import AccessTracker, CleanupRule, ResourceType, get_resource_cleaner
 from ..utils.logging import get_logger
 
 logger = get_logger("task_manager")
@@ -17,6 +18,7 @@ class TaskManager:
         self._completed_tasks: List[Dict[str, Any]] = []
         self._lock = threading.RLock()  # RLock pour éviter les deadlocks
         self._max_completed_tasks = 1000  # Limiter la mémoire
+        self._access_tracker = AccessTracker(k=2)  # Éviction LRU-2 des tâches terminées
         
     def add_task(self, task_id: str, task_data: Dict[str, Any]) -> None:
         """Ajouter une tâche active."""
@@ -55,11 +57,10 @@ class TaskManager:
             
             # Ajouter aux tâches terminées
             self._completed_tasks.append(task)
+            self._access_tracker.record_access(task_id)
             
             # Limiter la taille de l'historique
-            if len(self._completed_tasks) > self._max_completed_tasks:
-                removed = self._completed_tasks.pop(0)
-                logger.debug(f"Removed old completed task: {removed.get('id', 'unknown')}")
+            self.evict_completed_tasks(self._max_completed_tasks)
             
             logger.debug(f"Task {task_id} marked as completed")
             return True
@@ -76,14 +77,60 @@ class TaskManager:
             task["failed_at"] = datetime.now(timezone.utc).isoformat()
             
             self._completed_tasks.append(task)
+            self._access_tracker.record_access(task_id)
             
             # Limiter la taille de l'historique
-            if len(self._completed_tasks) > self._max_completed_tasks:
-                self._completed_tasks.pop(0)
+            self.evict_completed_tasks(self._max_completed_tasks)
             
             logger.warning(f"Task {task_id} marked as failed: {error_message}")
             return True
     
+    def find_completed_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Récupérer une tâche terminée par ID (sans compter d'accès).
+        
+        Les consultations de statut et les interrogations en attente du
+        résultat ne doivent pas rendre une tâche « chaude » pour l'éviction.
+        """
+        with self._lock:
+            return next(
+                (task for task in self._completed_tasks if task.get("id") == task_id), None
+            )
+    
+    def mark_result_read(self, task_id: str) -> None:
+        """Compter une lecture effective du résultat d'une tâche terminée (LRU-2)."""
+        with self._lock:
+            if task_id in self._access_tracker:
+                self._access_tracker.record_access(task_id)
+    
+    def evict_completed_tasks(self, max_tasks: int) -> int:
+        """Réduire l'historique à `max_tasks` tâches terminées (éviction LRU-2).
+        
+        Les tâches consultées une seule fois partent avant celles qui sont
+        relues régulièrement.
+        """
+        with self._lock:
+            excess = len(self._completed_tasks) - max_tasks
+            if excess <= 0:
+                return 0
+            
+            victims = set(self._access_tracker.select_victims(excess))
+            self._completed_tasks = [
+                task for task in self._completed_tasks if task.get("id") not in victims
+            ]
+            for task_id in victims:
+                self._access_tracker.forget(task_id)
+            
+            logger.debug(f"Evicted {len(victims)} completed tasks")
+            return len(victims)
+    
+    def cleanup_callback(self, rule: CleanupRule) -> Dict[str, Any]:
+        """Callback de nettoyage pour la règle TASKS du ResourceCleaner.
+        
+        La règle déclenche le nettoyage ; la rétention reste celle du
+        gestionnaire (`_max_completed_tasks`), pas le seuil de la règle.
+        """
+        return {"items_cleaned": self.evict_completed_tasks(self._max_completed_tasks)}
+    
     def get_active_tasks(self) -> Dict[str, Dict[str, Any]]:
         """Récupérer toutes les tâches actives."""
         with self._lock:
@@ -120,10 +167,13 @@ class TaskManager:
             cutoff_time = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
             initial_count = len(self._completed_tasks)
             
-            self._completed_tasks = [
-                task for task in self._completed_tasks
-                if datetime.fromisoformat(task.get("completed_at", task.get("failed_at", ""))).replace(tzinfo=timezone.utc).timestamp() > cutoff_time
-            ]
+            kept_tasks = []
+            for task in self._completed_tasks:
+                if datetime.fromisoformat(task.get("completed_at", task.get("failed_at", ""))).replace(tzinfo=timezone.utc).timestamp() > cutoff_time:
+                    kept_tasks.append(task)
+                else:
+                    self._access_tracker.forget(task.get("id"))
+            self._completed_tasks = kept_tasks
             
             removed_count = initial_count - len(self._completed_tasks)
             if removed_count > 0:
@@ -136,6 +186,7 @@ class TaskManager:
         with self._lock:
             self._active_tasks.clear()
             self._completed_tasks.clear()
+            self._access_tracker = AccessTracker(k=2)
             logger.info("All tasks cleared")
 
 
@@ -152,6 +203,9 @@ def get_task_manager() -> TaskManager:
         with _instance_lock:
             if _task_manager_instance is None:
                 _task_manager_instance = TaskManager()
+                get_resource_cleaner().add_cleanup_callback(
+                    ResourceType.TASKS, _task_manager_instance.cleanup_callback
+                )
                 logger.info("TaskManager instance created")
     
     return _task_manager_instance
@@ -161,4 +215,8 @@ def reset_task_manager() -> None:
     """Réinitialiser l'instance (pour tests)."""
     global _task_manager_instance
     with _instance_lock:
+        if _task_manager_instance is not None:
+            get_resource_cleaner().remove_cleanup_callback(
+                ResourceType.TASKS, _task_manager_instance.cleanup_callback
+            )
         _task_manager_instance = None
\ No newline at end of file
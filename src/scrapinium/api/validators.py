@@ -22,6 +22,25 @@ BLOCKED_DOMAINS = {
     "metadata.google.internal", "169.254.169.254"
 }
 
+# Caractères interdits dans une URL, trouvés en une seule passe
+_DANGEROUS_URL_CHARS = re.compile(r'[<>"\'&\x00\x01\x02]')
+
+# Patterns suspects des instructions, réunis en une seule alternance
+# (un groupe par pattern : m.lastindex retrouve celui qui a matché)
+SUSPICIOUS_PATTERNS = (
+    r'<script[^>]*>',
+    r'javascript:',
+    r'data:',
+    r'vbscript:',
+    r'file://',
+    r'ftp://',
+    r'\$\{.*\}',  # Template injection
+    r'\{\{.*\}\}',  # Template injection
+)
+_SUSPICIOUS = re.compile(
+    "|".join(f"({pattern})" for pattern in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+
 
 class ScrapingTaskRequest(BaseModel):
     """Modèle validé pour les requêtes de scraping."""
@@ -70,10 +89,9 @@ class ScrapingTaskRequest(BaseModel):
             pass
         
         # Vérifier les caractères dangereux
-        dangerous_chars = ["<", ">", "\"", "'", "&", "\x00", "\x01", "\x02"]
-        for char in dangerous_chars:
-            if char in url_str:
-                raise SecurityError(f"Caractère dangereux détecté dans l'URL: {repr(char)}")
+        match = _DANGEROUS_URL_CHARS.search(url_str)
+        if match:
+            raise SecurityError(f"Caractère dangereux détecté dans l'URL: {repr(match.group())}")
         
         return v
     
@@ -92,21 +110,11 @@ class ScrapingTaskRequest(BaseModel):
         if control_chars:
             raise SecurityError("Caractères de contrôle détectés dans les instructions")
         
-        # Vérifier les patterns suspects
-        suspicious_patterns = [
-            r'<script[^>]*>',
-            r'javascript:',
-            r'data:',
-            r'vbscript:',
-            r'file://',
-            r'ftp://',
-            r'\$\{.*\}',  # Template injection
-            r'\{\{.*\}\}',  # Template injection
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise SecurityError(f"Pattern suspect détecté dans les instructions: {pattern}")
+        # Vérifier les patterns suspects (un seul parcours du texte)
+        match = _SUSPICIOUS.search(v)
+        if match:
+            pattern = SUSPICIOUS_PATTERNS[match.lastindex - 1]
+            raise SecurityError(f"Pattern suspect détecté dans les instructions: {pattern}")
         
         return v.strip()
 
@@ -11,11 +11,17 @@ from .helpers import (
     safe_get,
     truncate_text,
 )
-from .validators import sanitize_filename, validate_content_length, validate_url
+from .validators import (
+    sanitize_filename,
+    validate_content_length,
+    validate_url,
+    validate_urls,
+)
 
 __all__ = [
     # Validators
     "validate_url",
+    "validate_urls",
     "sanitize_filename",
     "validate_content_length",
     # Helpers
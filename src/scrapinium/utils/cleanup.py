@@ -2,12 +2,18 @@
 
 import asyncio
 import gc
+import heapq
+import math
 import time
 import weakref
-from typing import Dict, List, Optional, Callable, Any, Set
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple, Deque, Hashable
 from dataclasses import dataclass, field
 from enum import Enum
 import os
+import stat
+import sys
 import tempfile
 import shutil
 
@@ -15,6 +21,17 @@ from ..config import get_logger
 
 logger = get_logger("utils.cleanup")
 
+# Préfixe des fichiers temporaires créés par Scrapinium
+TEMP_FILE_PREFIX = "scrapinium_"
+
+# Âge maximal (secondes) des fichiers temporaires sans règle explicite
+DEFAULT_TEMP_MAX_AGE = 3600
+
+# Lecture rapide du RSS sous Linux
+_PROC_STATM_PATH = "/proc/self/statm"
+_HAS_PROC_STATM = sys.platform.startswith("linux") and os.path.exists(_PROC_STATM_PATH)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
 
 class ResourceType(str, Enum):
     """Types de ressources à nettoyer."""
@@ -53,72 +70,97 @@ class CleanupResult:
 
 
 class ResourceTracker:
-    """Trackeur de ressources pour identifier les fuites."""
+    """Trackeur de ressources pour identifier les fuites.
+    
+    Chaque type de ressource est indexé dans un WeakKeyDictionary : les
+    entrées disparaissent avec l'objet, sans clé id() réutilisable. L'ordre
+    d'insertion place les plus anciennes ressources en tête, ce qui permet de
+    trouver les ressources expirées sans parcourir tout le tracking.
+    Les objets trackés doivent être hashables et supporter les weak references.
+    """
     
     def __init__(self):
-        self.tracked_objects: Dict[str, Set[weakref.ref]] = {
-            resource_type.value: set() for resource_type in ResourceType
+        # obj -> (creation_time monotonic, taille en octets)
+        self.tracked_objects: Dict[str, "weakref.WeakKeyDictionary[Any, Tuple[float, int]]"] = {
+            resource_type.value: weakref.WeakKeyDictionary() for resource_type in ResourceType
         }
-        self.creation_times: Dict[int, float] = {}
-        self.resource_sizes: Dict[int, int] = {}
     
     def track_resource(self, obj: Any, resource_type: ResourceType, size_bytes: int = 0):
         """Ajoute un objet au tracking."""
-        obj_id = id(obj)
-        self.creation_times[obj_id] = time.time()
-        self.resource_sizes[obj_id] = size_bytes
-        
-        # Créer une weak reference avec callback de nettoyage
-        def cleanup_callback(ref):
-            self.creation_times.pop(obj_id, None)
-            self.resource_sizes.pop(obj_id, None)
-            self.tracked_objects[resource_type.value].discard(ref)
-        
-        weak_ref = weakref.ref(obj, cleanup_callback)
-        self.tracked_objects[resource_type.value].add(weak_ref)
-    
-    def get_resource_stats(self) -> Dict[str, Any]:
-        """Retourne les statistiques des ressources trackées."""
-        current_time = time.time()
+        entries = self.tracked_objects[resource_type.value]
+        
+        # Un objet re-tracké repart en fin d'index avec un nouvel âge
+        entries.pop(obj, None)
+        entries[obj] = (time.monotonic(), size_bytes)
+    
+    def touch(self, obj: Any, resource_type: ResourceType):
+        """Marque une ressource comme récemment utilisée (rafraîchit son âge)."""
+        entries = self.tracked_objects[resource_type.value]
+        entry = entries.pop(obj, None)
+        if entry is not None:
+            entries[obj] = (time.monotonic(), entry[1])
+    
+    def get_resource_stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Retourne les statistiques des ressources trackées.
+        
+        Args:
+            now: Instant de référence (time.monotonic()) partagé par le cycle
+        """
+        current_time = time.monotonic() if now is None else now
         stats = {}
         
-        for resource_type, refs in self.tracked_objects.items():
-            # Nettoyer les références mortes
-            live_refs = {ref for ref in refs if ref() is not None}
-            self.tracked_objects[resource_type] = live_refs
-            
-            # Calculer les stats
-            live_objects = [ref() for ref in live_refs if ref() is not None]
-            ages = [current_time - self.creation_times.get(id(obj), current_time) 
-                   for obj in live_objects if id(obj) in self.creation_times]
-            sizes = [self.resource_sizes.get(id(obj), 0) 
-                    for obj in live_objects if id(obj) in self.resource_sizes]
+        for resource_type, entries in self.tracked_objects.items():
+            # Accumulation en une seule passe, sans listes intermédiaires
+            count = 0
+            age_sum = 0.0
+            age_max = 0.0
+            size_sum = 0
+            for created, size in entries.values():
+                age = current_time - created
+                age_sum += age
+                if age > age_max:
+                    age_max = age
+                size_sum += size
+                count += 1
             
             stats[resource_type] = {
-                "count": len(live_objects),
-                "avg_age_seconds": sum(ages) / len(ages) if ages else 0,
-                "max_age_seconds": max(ages) if ages else 0,
-                "total_size_bytes": sum(sizes),
-                "avg_size_bytes": sum(sizes) / len(sizes) if sizes else 0,
+                "count": count,
+                "avg_age_seconds": age_sum / count if count else 0,
+                "max_age_seconds": age_max,
+                "total_size_bytes": size_sum,
+                "avg_size_bytes": size_sum / count if count else 0,
             }
         
         return stats
     
-    def find_old_resources(self, max_age_seconds: float) -> Dict[ResourceType, List[Any]]:
-        """Trouve les ressources anciennes."""
-        current_time = time.time()
+    def get_counts(self) -> Dict[str, int]:
+        """Retourne le nombre de ressources trackées par type."""
+        return {resource_type: len(entries) for resource_type, entries in self.tracked_objects.items()}
+    
+    def get_max_age(self, resource_type: ResourceType, now: Optional[float] = None) -> float:
+        """Retourne l'âge de la plus ancienne ressource vivante d'un type."""
+        for created, _ in self.tracked_objects[resource_type.value].values():
+            return (time.monotonic() if now is None else now) - created
+        return 0.0
+    
+    def find_old_resources(
+        self, max_age_seconds: float, now: Optional[float] = None
+    ) -> Dict[ResourceType, List[Any]]:
+        """Trouve les ressources anciennes.
+        
+        Le parcours de chaque index s'arrête à la première ressource trop
+        jeune : le coût est proportionnel au nombre de ressources expirées.
+        """
+        cutoff = (time.monotonic() if now is None else now) - max_age_seconds
         old_resources = {}
         
-        for resource_type, refs in self.tracked_objects.items():
+        for resource_type, entries in self.tracked_objects.items():
             old_objects = []
             
-            for ref in refs:
-                obj = ref()
-                if obj is not None:
-                    obj_id = id(obj)
-                    age = current_time - self.creation_times.get(obj_id, current_time)
-                    if age > max_age_seconds:
-                        old_objects.append(obj)
+            for obj, (created, _) in entries.items():
+                if created >= cutoff:
+                    break
+                old_objects.append(obj)
             
             if old_objects:
                 old_resources[ResourceType(resource_type)] = old_objects
@@ -126,14 +168,67 @@ class ResourceTracker:
         return old_resources
 
 
+class AccessTracker:
+    """Historique des k derniers accès par clé, pour une éviction LRU-k.
+    
+    Les clés sont gardées dans l'ordre du dernier accès. Seule la fraction
+    la moins récemment utilisée est évaluée lors d'une éviction : les clés
+    accédées moins de k fois (accès ponctuels) partent en premier, puis
+    celles dont le k-ième accès le plus récent est le plus ancien.
+    """
+    
+    def __init__(self, k: int = 2, shortlist_ratio: float = 0.1):
+        self.k = k
+        self.shortlist_ratio = shortlist_ratio
+        self._history: "OrderedDict[Hashable, Deque[float]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._history)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._history
+    
+    def record_access(self, key: Hashable):
+        """Enregistre un accès à une clé."""
+        history = self._history.get(key)
+        if history is None:
+            history = self._history[key] = deque(maxlen=self.k)
+        else:
+            self._history.move_to_end(key)
+        history.append(time.monotonic())
+    
+    def forget(self, key: Hashable):
+        """Retire une clé de l'historique."""
+        self._history.pop(key, None)
+    
+    def select_victims(self, count: int) -> List[Hashable]:
+        """Sélectionne les `count` clés à évincer en priorité."""
+        if count <= 0:
+            return []
+        
+        shortlist_size = max(count, math.ceil(len(self._history) * self.shortlist_ratio))
+        shortlist = islice(self._history.items(), shortlist_size)
+        
+        def eviction_score(item: Tuple[Hashable, Deque[float]]) -> Tuple[int, float]:
+            _, history = item
+            # Moins de k accès : distance infinie, départager par l'ancienneté
+            if len(history) < self.k:
+                return (1, -history[-1])
+            return (0, -history[0])
+        
+        return [key for key, _ in heapq.nlargest(count, shortlist, key=eviction_score)]
+
+
 class ResourceCleaner:
     """Nettoyeur de ressources avec règles configurables."""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_callbacks: int = 10):
         self.rules: List[CleanupRule] = []
         self.tracker = ResourceTracker()
         self.cleanup_callbacks: Dict[ResourceType, List[Callable]] = {}
         self.temp_dirs: Set[str] = set()
+        self.max_concurrent_callbacks = max_concurrent_callbacks
+        self._process = None  # psutil.Process créé à la demande
         
         # Règles par défaut
         self._setup_default_rules()
@@ -163,7 +258,7 @@ class ResourceCleaner:
             CleanupRule(
                 resource_type=ResourceType.TEMP_FILES,
                 condition="age",
-                threshold=3600,  # secondes
+                threshold=DEFAULT_TEMP_MAX_AGE,  # secondes
                 action="delete",
                 priority=3,
             ),
@@ -193,35 +288,53 @@ class ResourceCleaner:
             self.cleanup_callbacks[resource_type] = []
         self.cleanup_callbacks[resource_type].append(callback)
     
+    def remove_cleanup_callback(self, resource_type: ResourceType, callback: Callable):
+        """Retire un callback de nettoyage précédemment enregistré."""
+        callbacks = self.cleanup_callbacks.get(resource_type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self.cleanup_callbacks[resource_type]
+    
     def track_temp_directory(self, temp_dir: str):
         """Ajoute un dossier temporaire au tracking."""
         self.temp_dirs.add(temp_dir)
         logger.debug(f"Dossier temporaire tracké: {temp_dir}")
     
+    def _get_rss(self) -> int:
+        """Retourne la mémoire résidente (RSS) du processus en octets.
+        
+        Sous Linux, lit directement /proc/self/statm ; sinon passe par un
+        psutil.Process mis en cache.
+        """
+        if _HAS_PROC_STATM:
+            try:
+                with open(_PROC_STATM_PATH, "rb") as statm:
+                    return int(statm.read().split()[1]) * _PAGE_SIZE
+            except (OSError, ValueError, IndexError):
+                pass
+        
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process(os.getpid())
+        return self._process.memory_info().rss
+    
     async def cleanup_memory(self) -> CleanupResult:
         """Nettoyage agressif de la mémoire."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Statistiques avant
-            import psutil
-            process = psutil.Process(os.getpid())
-            memory_before = process.memory_info().rss
+            memory_before = self._get_rss()
             
-            # Garbage collection agressif
-            collected = 0
-            for generation in range(3):
-                collected += gc.collect(generation)
-            
-            # Forcer la libération des caches Python
-            gc.disable()
-            gc.enable()
+            # Collecte complète (toutes générations en une passe)
+            collected = gc.collect()
             
             # Statistiques après
-            memory_after = process.memory_info().rss
+            memory_after = self._get_rss()
             bytes_freed = max(0, memory_before - memory_after)
             
-            time_taken = (time.time() - start_time) * 1000
+            time_taken = (time.perf_counter_ns() - start_ns) / 1e6
             
             logger.info(f"Nettoyage mémoire: {bytes_freed // 1024 // 1024}MB libérés, {collected} objets collectés")
             
@@ -235,7 +348,7 @@ class ResourceCleaner:
             )
             
         except Exception as e:
-            time_taken = (time.time() - start_time) * 1000
+            time_taken = (time.perf_counter_ns() - start_ns) / 1e6
             logger.error(f"Erreur nettoyage mémoire: {e}")
             
             return CleanupResult(
@@ -247,48 +360,63 @@ class ResourceCleaner:
                 error_message=str(e)
             )
     
-    async def cleanup_temp_files(self) -> CleanupResult:
-        """Nettoyage des fichiers temporaires."""
-        start_time = time.time()
+    async def cleanup_temp_files(
+        self, rule: Optional[CleanupRule] = None, now: Optional[float] = None
+    ) -> CleanupResult:
+        """Nettoyage des fichiers temporaires.
+        
+        Args:
+            rule: Règle TEMP_FILES dont le seuil donne l'âge maximal (secondes)
+            now: Horodatage (time.time()) du cycle, comparé aux ctime des fichiers
+        """
+        max_age = rule.threshold if rule is not None else DEFAULT_TEMP_MAX_AGE
+        start_ns = time.perf_counter_ns()
         files_cleaned = 0
         bytes_freed = 0
         
         try:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             
             # Nettoyer les dossiers trackés
             for temp_dir in list(self.temp_dirs):
-                if os.path.exists(temp_dir):
-                    try:
-                        # Vérifier l'âge des fichiers
-                        dir_age = current_time - os.path.getctime(temp_dir)
-                        if dir_age > 3600:  # > 1 heure
-                            dir_size = self._get_directory_size(temp_dir)
-                            shutil.rmtree(temp_dir)
-                            files_cleaned += 1
-                            bytes_freed += dir_size
-                            self.temp_dirs.discard(temp_dir)
-                            logger.debug(f"Dossier temporaire supprimé: {temp_dir}")
-                    except Exception as e:
-                        logger.warning(f"Erreur suppression {temp_dir}: {e}")
+                try:
+                    # Un seul stat : existence et âge du dossier
+                    dir_age = current_time - os.stat(temp_dir).st_ctime
+                except FileNotFoundError:
+                    self.temp_dirs.discard(temp_dir)
+                    continue
+                except OSError as e:
+                    logger.warning(f"Erreur suppression {temp_dir}: {e}")
+                    continue
+                
+                if dir_age > max_age:
+                    dir_size = self._get_directory_size(temp_dir)
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    files_cleaned += 1
+                    bytes_freed += dir_size
+                    self.temp_dirs.discard(temp_dir)
+                    logger.debug(f"Dossier temporaire supprimé: {temp_dir}")
             
             # Nettoyer le dossier temporaire système
+            # scandir + un seul stat par entrée (au lieu de isfile/getctime/getsize)
             temp_dir = tempfile.gettempdir()
-            for item in os.listdir(temp_dir):
-                if item.startswith('scrapinium_'):
-                    item_path = os.path.join(temp_dir, item)
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(TEMP_FILE_PREFIX):
+                        continue
                     try:
-                        if os.path.isfile(item_path):
-                            file_age = current_time - os.path.getctime(item_path)
-                            if file_age > 7200:  # > 2 heures
-                                file_size = os.path.getsize(item_path)
-                                os.remove(item_path)
-                                files_cleaned += 1
-                                bytes_freed += file_size
-                    except Exception as e:
-                        logger.warning(f"Erreur suppression fichier temp {item_path}: {e}")
+                        file_stat = entry.stat(follow_symlinks=False)
+                        if not stat.S_ISREG(file_stat.st_mode):
+                            continue
+                        file_age = current_time - file_stat.st_ctime
+                        if file_age > max_age:
+                            os.unlink(entry.path)
+                            files_cleaned += 1
+                            bytes_freed += file_stat.st_size
+                    except OSError as e:
+                        logger.warning(f"Erreur suppression fichier temp {entry.path}: {e}")
             
-            time_taken = (time.time() - start_time) * 1000
+            time_taken = (time.perf_counter_ns() - start_ns) / 1e6
             
             return CleanupResult(
                 resource_type=ResourceType.TEMP_FILES,
@@ -300,7 +428,7 @@ class ResourceCleaner:
             )
             
         except Exception as e:
-            time_taken = (time.time() - start_time) * 1000
+            time_taken = (time.perf_counter_ns() - start_ns) / 1e6
             logger.error(f"Erreur nettoyage fichiers temp: {e}")
             
             return CleanupResult(
@@ -315,20 +443,53 @@ class ResourceCleaner:
     def _get_directory_size(self, directory: str) -> int:
         """Calcule la taille d'un dossier."""
         total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except OSError:
-                        pass
-        except OSError:
-            pass
+        pending = [directory]
+        
+        # scandir réutilise les infos du dirent : un seul stat par fichier
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            else:
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
         return total_size
     
-    async def run_cleanup_rule(self, rule: CleanupRule) -> CleanupResult:
-        """Exécute une règle de nettoyage spécifique."""
+    async def _run_callbacks(self, callbacks: List[Callable], rule: CleanupRule) -> List[Any]:
+        """Exécute les callbacks d'une règle avec une concurrence bornée.
+        
+        Les callbacks synchrones sont déportés dans un thread pour ne pas
+        bloquer la boucle d'événements. Les exceptions sont retournées.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_callbacks)
+        
+        async def run_one(callback: Callable) -> Any:
+            async with semaphore:
+                if asyncio.iscoroutinefunction(callback):
+                    return await callback(rule)
+                return await asyncio.to_thread(callback, rule)
+        
+        return await asyncio.gather(
+            *(run_one(callback) for callback in callbacks),
+            return_exceptions=True,
+        )
+    
+    async def run_cleanup_rule(self, rule: CleanupRule, now: Optional[float] = None) -> CleanupResult:
+        """Exécute une règle de nettoyage spécifique.
+        
+        Args:
+            rule: Règle à exécuter
+            now: Horodatage (time.time()) partagé par le cycle de nettoyage
+        """
+        if now is None:
+            now = time.time()
+        
         if not rule.enabled:
             return CleanupResult(
                 resource_type=rule.resource_type,
@@ -339,7 +500,7 @@ class ResourceCleaner:
                 details={"skipped": "rule_disabled"}
             )
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Exécuter selon le type de ressource
@@ -347,27 +508,24 @@ class ResourceCleaner:
                 result = await self.cleanup_memory()
             
             elif rule.resource_type == ResourceType.TEMP_FILES:
-                result = await self.cleanup_temp_files()
+                result = await self.cleanup_temp_files(rule, now)
             
             elif rule.resource_type in self.cleanup_callbacks:
-                # Exécuter les callbacks personnalisés
+                # Exécuter les callbacks personnalisés en parallèle (concurrence bornée)
                 total_cleaned = 0
                 total_freed = 0
                 
-                for callback in self.cleanup_callbacks[rule.resource_type]:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            callback_result = await callback(rule)
-                        else:
-                            callback_result = callback(rule)
-                        
-                        if isinstance(callback_result, dict):
-                            total_cleaned += callback_result.get("items_cleaned", 0)
-                            total_freed += callback_result.get("bytes_freed", 0)
-                    except Exception as e:
-                        logger.warning(f"Erreur callback nettoyage {rule.resource_type}: {e}")
+                callbacks = self.cleanup_callbacks[rule.resource_type]
+                callback_results = await self._run_callbacks(callbacks, rule)
                 
-                time_taken = (time.time() - start_time) * 1000
+                for callback_result in callback_results:
+                    if isinstance(callback_result, Exception):
+                        logger.warning(f"Erreur callback nettoyage {rule.resource_type}: {callback_result}")
+                    elif isinstance(callback_result, dict):
+                        total_cleaned += callback_result.get("items_cleaned", 0)
+                        total_freed += callback_result.get("bytes_freed", 0)
+                
+                time_taken = (time.perf_counter_ns() - start_ns) / 1e6
                 result = CleanupResult(
                     resource_type=rule.resource_type,
                     items_cleaned=total_cleaned,
@@ -388,7 +546,7 @@ class ResourceCleaner:
                 )
             
             # Mettre à jour les stats de la règle
-            rule.last_run = time.time()
+            rule.last_run = now
             if result.success:
                 rule.success_count += 1
             else:
@@ -397,7 +555,7 @@ class ResourceCleaner:
             return result
             
         except Exception as e:
-            time_taken = (time.time() - start_time) * 1000
+            time_taken = (time.perf_counter_ns() - start_ns) / 1e6
             rule.failure_count += 1
             
             return CleanupResult(
@@ -409,15 +567,75 @@ class ResourceCleaner:
                 error_message=str(e)
             )
     
-    async def run_all_cleanup_rules(self) -> List[CleanupResult]:
-        """Exécute toutes les règles de nettoyage."""
+    def _collect_indicators(self) -> Dict[str, Any]:
+        """Collecte en une passe les indicateurs peu coûteux des règles."""
+        indicators: Dict[str, Any] = {
+            "tracked_counts": self.tracker.get_counts(),
+        }
+        
+        try:
+            indicators["rss_mb"] = self._get_rss() / 1024 / 1024
+        except Exception:
+            indicators["rss_mb"] = None
+        
+        return indicators
+    
+    def _should_run(self, rule: CleanupRule, indicators: Dict[str, Any], now: float) -> bool:
+        """Indique si le seuil d'une règle est atteint.
+        
+        Une condition inconnue ou non mesurable déclenche la règle.
+        """
+        if rule.condition == "memory_usage":
+            rss_mb = indicators.get("rss_mb")
+            return rss_mb is None or rss_mb >= rule.threshold
+        
+        if rule.condition == "count":
+            # Les callbacks enregistrés comptent eux-mêmes leurs éléments
+            if rule.resource_type in self.cleanup_callbacks:
+                return True
+            return indicators["tracked_counts"][rule.resource_type.value] >= rule.threshold
+        
+        if rule.condition == "age":
+            if rule.resource_type == ResourceType.TEMP_FILES:
+                # Les fichiers du dossier système ne sont pas trackés :
+                # on garantit au moins un passage par période de seuil.
+                if now - rule.last_run >= rule.threshold:
+                    return True
+                for temp_dir in self.temp_dirs:
+                    try:
+                        if now - os.stat(temp_dir).st_ctime > rule.threshold:
+                            return True
+                    except OSError:
+                        continue
+                return False
+            return self.tracker.get_max_age(rule.resource_type) > rule.threshold
+        
+        return True
+    
+    async def run_all_cleanup_rules(
+        self, force: bool = False, now: Optional[float] = None
+    ) -> List[CleanupResult]:
+        """Exécute les règles de nettoyage dont le seuil est atteint.
+        
+        Args:
+            force: Exécute toutes les règles actives sans vérifier les seuils
+            now: Horodatage (time.time()) unique pour tout le cycle
+        """
+        if now is None:
+            now = time.time()
         results = []
         
-        # Trier par priorité
+        # Trier par priorité, en ignorant les règles dont le seuil n'est pas atteint
         sorted_rules = sorted(self.rules, key=lambda r: r.priority)
+        if not force:
+            indicators = self._collect_indicators()
+            sorted_rules = [
+                rule for rule in sorted_rules
+                if rule.enabled and self._should_run(rule, indicators, now)
+            ]
         
         for rule in sorted_rules:
-            result = await self.run_cleanup_rule(rule)
+            result = await self.run_cleanup_rule(rule, now)
             results.append(result)
             
             # Log du résultat
@@ -470,6 +688,7 @@ class AutoCleaner:
         self.running = False
         self._task: Optional[asyncio.Task] = None
         self.last_cleanup_time = 0
+        self.last_cycle_duration_ms = 0.0
         self.cleanup_count = 0
     
     async def start(self):
@@ -501,7 +720,10 @@ class AutoCleaner:
                 
                 if self.running:  # Vérifier encore après le sleep
                     logger.debug("Démarrage du cycle de nettoyage automatique")
-                    results = await self.cleaner.run_all_cleanup_rules()
+                    now = time.time()
+                    cycle_start_ns = time.perf_counter_ns()
+                    results = await self.cleaner.run_all_cleanup_rules(now=now)
+                    self.last_cycle_duration_ms = (time.perf_counter_ns() - cycle_start_ns) / 1e6
                     
                     # Log du résumé
                     total_items = sum(r.items_cleaned for r in results)
@@ -510,10 +732,11 @@ class AutoCleaner:
                     if total_items > 0 or total_bytes > 0:
                         logger.info(
                             f"Cycle de nettoyage terminé: "
-                            f"{total_items} items, {total_bytes // 1024 // 1024}MB libérés"
+                            f"{total_items} items, {total_bytes // 1024 // 1024}MB libérés "
+                            f"en {self.last_cycle_duration_ms:.1f}ms"
                         )
                     
-                    self.last_cleanup_time = time.time()
+                    self.last_cleanup_time = now
                     self.cleanup_count += 1
                     
             except asyncio.CancelledError:
@@ -530,6 +753,7 @@ class AutoCleaner:
             "interval_seconds": self.interval_seconds,
             "last_cleanup_time": self.last_cleanup_time,
             "cleanup_count": self.cleanup_count,
+            "last_cycle_duration_ms": self.last_cycle_duration_ms,
             "time_since_last_cleanup": time.time() - self.last_cleanup_time,
         }
 
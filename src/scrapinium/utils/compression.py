@@ -1,18 +1,91 @@
 """Utilitaires de compression pour optimiser le stockage."""
 
-import gzip
-import zlib
+import lz4.block
 import lz4.frame
 import brotli
-from typing import Union, Tuple, Dict, Any
+import zstandard as zstd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Union, Tuple, Dict, Any, Iterable, Deque, Callable, Optional
+from collections import OrderedDict, deque
 from enum import Enum
+from pathlib import Path
 import json
+import os
+import hashlib
 import pickle
+import threading
+import time
 
 from ..config import get_logger
 
+# zlib-ng (implémentation DEFLATE vectorisée) si disponible, sinon stdlib
+try:
+    from zlib_ng import gzip_ng as gzip
+    from zlib_ng import zlib_ng as zlib
+    ZLIB_NG_AVAILABLE = True
+except ImportError:
+    import gzip
+    import zlib
+    ZLIB_NG_AVAILABLE = False
+
+# Sérialiseurs C optionnels (repli sur json/pickle)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Hash non cryptographique rapide pour le cache d'identité (repli blake2b)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = get_logger("utils.compression")
 
+# Sonde d'entropie : au-delà de ce ratio LZ4 sur un échantillon, les données
+# sont considérées incompressibles (déjà compressées, images, vidéos...)
+PROBE_SAMPLE_SIZE = 4096
+INCOMPRESSIBLE_RATIO = 0.95
+
+# Taille de la fenêtre des temps récents utilisée pour le p95
+RECENT_TIMES_WINDOW = 128
+
+# Dictionnaires zstd entraînés sur les contenus récents (texte/JSON)
+ZSTD_DICT_SIZE = 128 * 1024
+ZSTD_RETRAIN_INTERVAL = 1000
+ZSTD_SAMPLE_BYTES = 4 * 1024  # Préfixe conservé de chaque échantillon
+ZSTD_DICT_HISTORY = 8  # Dictionnaires gardés en mémoire (les autres sont relus du disque)
+# Registre persistant : chaque dictionnaire est stocké une seule fois, sous
+# son dict_id, et reste disponible après un redémarrage
+ZSTD_DICT_DIR = Path(os.environ.get("SCRAPINIUM_ZSTD_DICT_DIR", "data/zstd_dicts"))
+
+# Cache des derniers résultats pour les contenus identiques répétés,
+# borné par le volume compressé total (pas par le nombre d'entrées)
+IDENTITY_CACHE_MAX_BYTES = 4 * 1024 * 1024
+IDENTITY_CACHE_MAX_ITEM_SIZE = 1024 * 1024  # Au-delà, ni empreinte ni mise en cache
+
+# Compression par frames indépendantes en parallèle pour les gros contenus
+PARALLEL_MIN_SIZE = 2 * 1024 * 1024
+PARALLEL_FRAME_SIZE = 256 * 1024
+
+# Pool partagé pour comparer les algorithmes en parallèle
+_bakeoff_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="compression")
+
+# Pool dédié aux frames (séparé pour éviter un interblocage quand une
+# compression du comparatif découpe elle-même ses données)
+_frames_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="compression-frames"
+)
+
 
 class CompressionAlgorithm(str, Enum):
     """Algorithmes de compression disponibles."""
@@ -20,11 +93,23 @@ class CompressionAlgorithm(str, Enum):
     ZLIB = "zlib" 
     LZ4 = "lz4"
     BROTLI = "brotli"
+    ZSTD = "zstd"
+    LZ4_BLOCK = "lz4_block"  # Bloc LZ4 brut : sans en-tête de frame ni checksum
 
 
 class CompressionResult:
     """Résultat d'une compression."""
     
+    # Pas de __dict__ : le comparatif crée de nombreuses instances éphémères
+    __slots__ = (
+        "compressed_data",
+        "original_size",
+        "compressed_size",
+        "algorithm",
+        "metadata",
+        "_ratio",
+    )
+    
     def __init__(
         self,
         compressed_data: bytes,
@@ -38,11 +123,12 @@ class CompressionResult:
         self.compressed_size = compressed_size
         self.algorithm = algorithm
         self.metadata = metadata or {}
+        self._ratio = compressed_size / original_size if original_size > 0 else 1.0
     
     @property
     def compression_ratio(self) -> float:
         """Ratio de compression (plus petit = meilleure compression)."""
-        return self.compressed_size / self.original_size if self.original_size > 0 else 1.0
+        return self._ratio
     
     @property
     def space_saved_percent(self) -> float:
@@ -67,59 +153,217 @@ class CompressionResult:
         }
 
 
-def compress_data(
-    data: Union[str, bytes, dict],
-    algorithm: CompressionAlgorithm = CompressionAlgorithm.GZIP,
-    level: int = 6
-) -> CompressionResult:
+def _lz4_level(level: int) -> int:
+    """Convertit un niveau 1-9 en niveau LZ4 (0-16)."""
+    return min(max(level - 3, 0), 16)
+
+
+def _brotli_quality(level: int) -> int:
+    """Convertit un niveau 1-9 en qualité Brotli (0-11)."""
+    return min(max(level - 1, 0), 11)
+
+
+# Compresseurs Brotli pré-paramétrés par qualité (0-11). brotli.Compressor ne
+# peut pas être réinitialisé entre deux messages : on ne réutilise donc que
+# les paramètres, pas le contexte d'encodage.
+_BROTLI_BY_QUALITY = tuple(partial(brotli.compress, quality=q) for q in range(12))
+
+
+def _lz4_block_compress(buf: bytes, level: int) -> bytes:
+    """Compresse un bloc LZ4 brut (la taille d'origine est préfixée sur 4 octets)."""
+    if level <= 3:
+        return lz4.block.compress(buf, mode='fast', acceleration=max(1, 10 - level))
+    return lz4.block.compress(buf, mode='high_compression', compression=level)
+
+
+def _zstd_level(level: int) -> int:
+    """Convertit un niveau 1-9 en niveau zstd (1-22)."""
+    return min(max(level, 1), 22)
+
+
+# Dictionnaires zstd connus, indexés par leur identifiant (présent dans
+# l'en-tête de chaque frame compressée avec un dictionnaire)
+_zstd_dictionaries: "OrderedDict[int, zstd.ZstdCompressionDict]" = OrderedDict()
+
+
+def _zstd_dictionary_path(dict_id: int) -> Path:
+    """Chemin du dictionnaire `dict_id` dans le registre persistant."""
+    return ZSTD_DICT_DIR / f"{dict_id}.zdict"
+
+
+def _cache_zstd_dictionary(dictionary: zstd.ZstdCompressionDict) -> None:
+    """Garde un dictionnaire en mémoire (les plus anciens sont oubliés)."""
+    _zstd_dictionaries[dictionary.dict_id()] = dictionary
+    _zstd_dictionaries.move_to_end(dictionary.dict_id())
+    while len(_zstd_dictionaries) > ZSTD_DICT_HISTORY:
+        _zstd_dictionaries.popitem(last=False)
+
+
+def _register_zstd_dictionary(dictionary: zstd.ZstdCompressionDict) -> None:
+    """Enregistre un dictionnaire zstd : en mémoire et, une fois, sur disque."""
+    _cache_zstd_dictionary(dictionary)
+    path = _zstd_dictionary_path(dictionary.dict_id())
+    if path.exists():
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(dictionary.as_bytes())
+        os.replace(tmp_path, path)  # Écriture atomique
+    except OSError as e:
+        logger.warning(f"Dictionnaire zstd {dictionary.dict_id()} non persisté: {e}")
+
+
+def _load_zstd_dictionary(dict_id: int) -> Optional[zstd.ZstdCompressionDict]:
+    """Retrouve un dictionnaire par son identifiant (mémoire, puis registre disque)."""
+    dictionary = _zstd_dictionaries.get(dict_id)
+    if dictionary is None:
+        try:
+            dictionary = zstd.ZstdCompressionDict(_zstd_dictionary_path(dict_id).read_bytes())
+        except OSError:
+            return None
+        _cache_zstd_dictionary(dictionary)
+    return dictionary
+
+
+def _zstd_compress(
+    buf: bytes, level: int, dictionary: zstd.ZstdCompressionDict = None
+) -> bytes:
+    """Compresse avec zstd, éventuellement avec un dictionnaire entraîné."""
+    return zstd.ZstdCompressor(level=_zstd_level(level), dict_data=dictionary).compress(buf)
+
+
+def _zstd_decompress(buf: bytes) -> bytes:
+    """Décompresse une frame zstd en retrouvant son dictionnaire éventuel."""
+    dictionary = None
+    dict_id = zstd.get_frame_parameters(buf).dict_id
+    if dict_id:
+        dictionary = _load_zstd_dictionary(dict_id)
+        if dictionary is None:
+            raise ValueError(f"Dictionnaire zstd inconnu: {dict_id} ({ZSTD_DICT_DIR})")
+    # decompressobj gère les frames sans taille de contenu (flux) et les
+    # frames concaténées (compression parallèle)
+    decompressor = zstd.ZstdDecompressor(dict_data=dictionary)
+    return decompressor.decompressobj(read_across_frames=True).decompress(buf)
+
+
+# Tables de dispatch : une recherche dans un dict au lieu d'une cascade de
+# comparaisons d'enum à chaque appel
+_COMPRESSORS: Dict[CompressionAlgorithm, Callable[[bytes, int], bytes]] = {
+    CompressionAlgorithm.GZIP: lambda buf, level: gzip.compress(buf, compresslevel=level),
+    CompressionAlgorithm.ZLIB: lambda buf, level: zlib.compress(buf, level=level),
+    CompressionAlgorithm.LZ4: lambda buf, level: lz4.frame.compress(
+        buf, compression_level=_lz4_level(level)
+    ),
+    CompressionAlgorithm.BROTLI: lambda buf, level: _BROTLI_BY_QUALITY[_brotli_quality(level)](buf),
+    CompressionAlgorithm.ZSTD: _zstd_compress,
+    CompressionAlgorithm.LZ4_BLOCK: _lz4_block_compress,
+}
+
+_DECOMPRESSORS: Dict[CompressionAlgorithm, Callable[[bytes], bytes]] = {
+    CompressionAlgorithm.GZIP: gzip.decompress,
+    CompressionAlgorithm.ZLIB: zlib.decompress,
+    CompressionAlgorithm.LZ4: lz4.frame.decompress,
+    CompressionAlgorithm.BROTLI: brotli.decompress,
+    CompressionAlgorithm.ZSTD: _zstd_decompress,
+    CompressionAlgorithm.LZ4_BLOCK: lz4.block.decompress,
+}
+
+
+# Formats dont les frames concaténées se décompressent en un seul appel
+_CONCATENABLE_ALGORITHMS = frozenset({CompressionAlgorithm.GZIP, CompressionAlgorithm.ZSTD})
+
+
+def _compress_parallel_frames(
+    buf: bytes, compress: Callable[[bytes, int], bytes], level: int
+) -> Tuple[bytes, int]:
+    """Compresse des tranches indépendantes en parallèle et concatène les frames."""
+    view = memoryview(buf)
+    frames = list(_frames_pool.map(
+        lambda start: compress(view[start:start + PARALLEL_FRAME_SIZE], level),
+        range(0, len(buf), PARALLEL_FRAME_SIZE),
+    ))
+    return b"".join(frames), len(frames)
+
+
+def _reject_unknown_type(obj: Any) -> Any:
+    """`default` strict : les types sans équivalent exact repassent par pickle."""
+    raise TypeError(f"Type non sérialisable: {type(obj).__name__}")
+
+
+# Les datetimes, dataclasses et sous-classes ne sont pas convertis par orjson
+# (ils reviendraient sous une autre forme) mais transmis à `default`
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+) if ORJSON_AVAILABLE else 0
+
+
+def _to_bytes(data: Union[str, bytes, dict, Any]) -> Tuple[bytes, str]:
     """
-    Compresse des données avec l'algorithme spécifié.
-    
-    Args:
-        data: Données à compresser
-        algorithm: Algorithme de compression
-        level: Niveau de compression (1-9, plus élevé = meilleure compression)
+    Sérialise des données en bytes et retourne leur type d'origine.
     
-    Returns:
-        CompressionResult: Résultat de la compression
+    Les dict/list suivent la sémantique JSON (clés converties en str, tuples
+    imbriqués en listes) ; les types que JSON ou msgpack ne restituent pas
+    à l'identique (datetime, set, tuple hors dict/list...) passent par pickle.
     """
-    # Préparer les données
-    if isinstance(data, dict):
-        original_data = json.dumps(data, ensure_ascii=False).encode('utf-8')
-        data_type = "json"
-    elif isinstance(data, str):
-        original_data = data.encode('utf-8')
-        data_type = "text"
-    elif isinstance(data, bytes):
-        original_data = data
-        data_type = "bytes"
-    else:
-        # Sérialiser avec pickle pour les autres types
-        original_data = pickle.dumps(data)
-        data_type = "pickle"
-    
+    if isinstance(data, str):
+        return data.encode('utf-8'), "text"
+    if isinstance(data, bytes):
+        return data, "bytes"
+    if isinstance(data, (dict, list)):
+        try:
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(data, default=_reject_unknown_type, option=_ORJSON_OPTIONS), "json"
+            return json.dumps(
+                data, ensure_ascii=False, default=_reject_unknown_type
+            ).encode('utf-8'), "json"
+        except (TypeError, ValueError):
+            pass  # Contenu non sérialisable exactement en JSON : pickle
+    elif MSGPACK_AVAILABLE:
+        try:
+            # strict_types : un tuple n'est pas écrit comme une liste
+            return msgpack.packb(
+                data, use_bin_type=True, strict_types=True, default=_reject_unknown_type
+            ), "msgpack"
+        except (TypeError, ValueError, OverflowError):
+            pass
+    # Sérialiser avec pickle en dernier recours
+    return pickle.dumps(data), "pickle"
+
+
+def _compress_bytes(
+    original_data: bytes,
+    data_type: str,
+    algorithm: CompressionAlgorithm,
+    level: int = 6,
+    zstd_dict: zstd.ZstdCompressionDict = None
+) -> CompressionResult:
+    """Compresse des données déjà sérialisées (voir `_to_bytes`)."""
     original_size = len(original_data)
     
-    # Compresser selon l'algorithme
     try:
-        if algorithm == CompressionAlgorithm.GZIP:
-            compressed_data = gzip.compress(original_data, compresslevel=level)
-        
-        elif algorithm == CompressionAlgorithm.ZLIB:
-            compressed_data = zlib.compress(original_data, level=level)
-        
-        elif algorithm == CompressionAlgorithm.LZ4:
-            # LZ4 a ses propres niveaux (0-16)
-            lz4_level = min(max(level - 3, 0), 16)  # Adapter le niveau
-            compressed_data = lz4.frame.compress(original_data, compression_level=lz4_level)
-        
-        elif algorithm == CompressionAlgorithm.BROTLI:
-            # Brotli niveau 0-11
-            brotli_level = min(max(level - 1, 0), 11)
-            compressed_data = brotli.compress(original_data, quality=brotli_level)
-        
+        metadata = {
+            "data_type": data_type,
+            "compression_level": level,
+        }
+        if zstd_dict is not None and algorithm == CompressionAlgorithm.ZSTD:
+            compressed_data = _zstd_compress(original_data, level, zstd_dict)
+            # Seul l'identifiant accompagne le payload : le dictionnaire est
+            # stocké une fois dans le registre persistant (ZSTD_DICT_DIR)
+            metadata["zstd_dict_id"] = zstd_dict.dict_id()
         else:
-            raise ValueError(f"Algorithme non supporté: {algorithm}")
+            compress = _COMPRESSORS.get(algorithm)
+            if compress is None:
+                raise ValueError(f"Algorithme non supporté: {algorithm}")
+            if original_size >= PARALLEL_MIN_SIZE and algorithm in _CONCATENABLE_ALGORITHMS:
+                compressed_data, metadata["frames"] = _compress_parallel_frames(
+                    original_data, compress, level
+                )
+            else:
+                compressed_data = compress(original_data, level)
         
         compressed_size = len(compressed_data)
         
@@ -128,10 +372,7 @@ def compress_data(
             original_size=original_size,
             compressed_size=compressed_size,
             algorithm=algorithm,
-            metadata={
-                "data_type": data_type,
-                "compression_level": level,
-            }
+            metadata=metadata
         )
         
     except Exception as e:
@@ -146,6 +387,171 @@ def compress_data(
         )
 
 
+_identity_cache: "OrderedDict[tuple, CompressionResult]" = OrderedDict()
+_identity_cache_bytes = 0  # Somme des compressed_size en cache
+_identity_cache_lock = threading.Lock()
+
+
+def _content_digest(buf: bytes) -> bytes:
+    """Empreinte rapide d'un contenu pour le cache d'identité."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_digest(buf)
+    return hashlib.blake2b(buf, digest_size=16).digest()
+
+
+def _compress_bytes_cached(
+    original_data: bytes,
+    data_type: str,
+    algorithm: CompressionAlgorithm,
+    level: int = 6,
+    zstd_dict: zstd.ZstdCompressionDict = None
+) -> CompressionResult:
+    """`_compress_bytes` avec un cache LRU des derniers contenus compressés."""
+    global _identity_cache_bytes
+    
+    if len(original_data) > IDENTITY_CACHE_MAX_ITEM_SIZE:
+        return _compress_bytes(original_data, data_type, algorithm, level, zstd_dict)
+    
+    key = (_content_digest(original_data), data_type, algorithm, level)
+    if algorithm == CompressionAlgorithm.ZSTD and zstd_dict is not None:
+        key += (zstd_dict.dict_id(),)  # Seul zstd dépend du dictionnaire
+    with _identity_cache_lock:
+        cached = _identity_cache.get(key)
+        if cached is not None:
+            _identity_cache.move_to_end(key)
+    
+    if cached is not None:
+        # Copie : les appelants enrichissent les métadonnées du résultat
+        return CompressionResult(
+            compressed_data=cached.compressed_data,
+            original_size=cached.original_size,
+            compressed_size=cached.compressed_size,
+            algorithm=cached.algorithm,
+            metadata={**cached.metadata, "cache_hit": True}
+        )
+    
+    result = _compress_bytes(original_data, data_type, algorithm, level, zstd_dict)
+    if "error" not in result.metadata:
+        with _identity_cache_lock:
+            previous = _identity_cache.pop(key, None)
+            if previous is not None:
+                _identity_cache_bytes -= previous.compressed_size
+            _identity_cache[key] = CompressionResult(
+                compressed_data=result.compressed_data,
+                original_size=result.original_size,
+                compressed_size=result.compressed_size,
+                algorithm=result.algorithm,
+                metadata=dict(result.metadata)
+            )
+            _identity_cache_bytes += result.compressed_size
+            while _identity_cache_bytes > IDENTITY_CACHE_MAX_BYTES:
+                _, evicted = _identity_cache.popitem(last=False)
+                _identity_cache_bytes -= evicted.compressed_size
+    return result
+
+
+def _estimated_ratio(data: bytes) -> float:
+    """Estime le ratio de compression à partir d'un échantillon LZ4 rapide."""
+    sample = data[:PROBE_SAMPLE_SIZE]
+    if not sample:
+        return 1.0
+    # Accélération minimale : au-delà, LZ4 saute trop de correspondances et
+    # une prose ordinaire paraît incompressible (0.97 au lieu de 0.69)
+    compressed = lz4.block.compress(sample, mode='fast', acceleration=1, store_size=False)
+    return len(compressed) / len(sample)
+
+
+def compress_data(
+    data: Union[str, bytes, dict],
+    algorithm: CompressionAlgorithm = CompressionAlgorithm.GZIP,
+    level: int = 6
+) -> CompressionResult:
+    """
+    Compresse des données avec l'algorithme spécifié.
+    
+    Args:
+        data: Données à compresser
+        algorithm: Algorithme de compression
+        level: Niveau de compression (1-9, plus élevé = meilleure compression)
+    
+    Returns:
+        CompressionResult: Résultat de la compression
+    """
+    original_data, data_type = _to_bytes(data)
+    return _compress_bytes_cached(original_data, data_type, algorithm, level)
+
+
+def _make_stream_compressor(algorithm: CompressionAlgorithm, level: int):
+    """Crée un compresseur incrémental : retourne (en-tête, feed, finish)."""
+    if algorithm == CompressionAlgorithm.GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 : format gzip
+        return b"", compressor.compress, compressor.flush
+    
+    if algorithm == CompressionAlgorithm.ZLIB:
+        compressor = zlib.compressobj(level)
+        return b"", compressor.compress, compressor.flush
+    
+    if algorithm == CompressionAlgorithm.LZ4:
+        compressor = lz4.frame.LZ4FrameCompressor(compression_level=_lz4_level(level))
+        return compressor.begin(), compressor.compress, compressor.flush
+    
+    if algorithm == CompressionAlgorithm.BROTLI:
+        compressor = brotli.Compressor(quality=_brotli_quality(level))
+        return b"", compressor.process, compressor.finish
+    
+    if algorithm == CompressionAlgorithm.ZSTD:
+        compressor = zstd.ZstdCompressor(level=_zstd_level(level)).compressobj()
+        return b"", compressor.compress, compressor.flush
+    
+    raise ValueError(f"Algorithme non supporté: {algorithm}")
+
+
+def compress_stream(
+    chunks: Iterable[Union[str, bytes]],
+    algorithm: CompressionAlgorithm = CompressionAlgorithm.GZIP,
+    level: int = 6
+) -> CompressionResult:
+    """
+    Compresse un flux de morceaux sans matérialiser l'entrée complète.
+    
+    Les morceaux passent dans un compresseur incrémental et la sortie est
+    accumulée dans un seul bytearray. Le résultat est décompressable avec
+    `decompress_data` comme un appel à `compress_data`.
+    
+    Args:
+        chunks: Morceaux de texte ou de bytes (un seul type par flux)
+        algorithm: Algorithme de compression
+        level: Niveau de compression (1-9)
+    
+    Returns:
+        CompressionResult: Résultat de la compression
+    """
+    header, feed, finish = _make_stream_compressor(algorithm, level)
+    output = bytearray(header)
+    original_size = 0
+    data_type = "bytes"
+    
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+            data_type = "text"
+        original_size += len(chunk)
+        output += feed(chunk)
+    output += finish()
+    
+    return CompressionResult(
+        compressed_data=bytes(output),
+        original_size=original_size,
+        compressed_size=len(output),
+        algorithm=algorithm,
+        metadata={
+            "data_type": data_type,
+            "compression_level": level,
+            "streamed": True,
+        }
+    )
+
+
 def decompress_data(
     compressed_data: bytes,
     algorithm: CompressionAlgorithm,
@@ -163,27 +569,20 @@ def decompress_data(
         Données décompressées dans leur format original
     """
     try:
-        # Décompresser selon l'algorithme
-        if algorithm == CompressionAlgorithm.GZIP:
-            decompressed = gzip.decompress(compressed_data)
-        
-        elif algorithm == CompressionAlgorithm.ZLIB:
-            decompressed = zlib.decompress(compressed_data)
-        
-        elif algorithm == CompressionAlgorithm.LZ4:
-            decompressed = lz4.frame.decompress(compressed_data)
-        
-        elif algorithm == CompressionAlgorithm.BROTLI:
-            decompressed = brotli.decompress(compressed_data)
-        
-        else:
+        decompress = _DECOMPRESSORS.get(algorithm)
+        if decompress is None:
             raise ValueError(f"Algorithme non supporté: {algorithm}")
+        decompressed = decompress(compressed_data)
         
         # Reconvertir selon le type original
         if data_type == "json":
+            if ORJSON_AVAILABLE:
+                return orjson.loads(decompressed)
             return json.loads(decompressed.decode('utf-8'))
         elif data_type == "text":
             return decompressed.decode('utf-8')
+        elif data_type == "msgpack":
+            return msgpack.unpackb(decompressed, raw=False, strict_map_key=False)
         elif data_type == "pickle":
             return pickle.loads(decompressed)
         else:
@@ -213,28 +612,53 @@ def get_best_compression(
     if algorithms is None:
         algorithms = list(CompressionAlgorithm)
     
-    # Vérifier si la compression vaut la peine
-    data_size = len(str(data).encode('utf-8')) if not isinstance(data, bytes) else len(data)
+    # Sérialiser une seule fois pour tous les algorithmes testés
+    original_data, data_type = _to_bytes(data)
+    data_size = len(original_data)
     
+    # Vérifier si la compression vaut la peine
     if data_size < min_size_threshold:
         logger.debug(f"Données trop petites pour compression: {data_size} < {min_size_threshold}")
         # Retourner sans compression
-        original_data = data.encode('utf-8') if isinstance(data, str) else data
         return CompressionResult(
             compressed_data=original_data,
             original_size=data_size,
             compressed_size=data_size,
             algorithm=CompressionAlgorithm.GZIP,  # Par défaut
-            metadata={"reason": "too_small", "threshold": min_size_threshold}
+            metadata={"reason": "too_small", "threshold": min_size_threshold, "data_type": data_type}
+        )
+    
+    # Éviter le comparatif complet sur des données incompressibles
+    probe_ratio = _estimated_ratio(original_data)
+    if probe_ratio > INCOMPRESSIBLE_RATIO:
+        logger.debug(f"Données incompressibles (ratio estimé {probe_ratio:.2f})")
+        return CompressionResult(
+            compressed_data=original_data,
+            original_size=data_size,
+            compressed_size=data_size,
+            algorithm=CompressionAlgorithm.GZIP,  # Par défaut
+            metadata={"reason": "incompressible", "probe_ratio": probe_ratio, "data_type": data_type}
         )
     
     best_result = None
     results = []
     
-    # Tester chaque algorithme
-    for algorithm in algorithms:
+    # Tester chaque algorithme (en parallèle : les codecs C libèrent le GIL)
+    if len(algorithms) > 1:
+        futures = [
+            _bakeoff_pool.submit(_compress_bytes, original_data, data_type, algorithm)
+            for algorithm in algorithms
+        ]
+        outcomes = [(algorithm, future.result) for algorithm, future in zip(algorithms, futures)]
+    else:
+        outcomes = [
+            (algorithm, partial(_compress_bytes, original_data, data_type, algorithm))
+            for algorithm in algorithms
+        ]
+    
+    for algorithm, get_result in outcomes:
         try:
-            result = compress_data(data, algorithm)
+            result = get_result()
             results.append(result)
             
             # Garder le meilleur (plus petit)
@@ -254,11 +678,11 @@ def get_best_compression(
         })
     
     return best_result or CompressionResult(
-        compressed_data=data.encode('utf-8') if isinstance(data, str) else data,
+        compressed_data=original_data,
         original_size=data_size,
         compressed_size=data_size,
         algorithm=CompressionAlgorithm.GZIP,
-        metadata={"error": "all_algorithms_failed"}
+        metadata={"error": "all_algorithms_failed", "data_type": data_type}
     )
 
 
@@ -286,6 +710,42 @@ def should_compress(
     return min_size <= data_size <= max_size
 
 
+def _size_bucket(data_size: int) -> str:
+    """Classe une taille de données pour la table de stratégies adaptatives."""
+    if data_size < 100 * 1024:  # < 100KB
+        return "small"
+    if data_size > 10 * 1024 * 1024:  # > 10MB
+        return "large"
+    return "medium"
+
+
+# (type de données, taille) -> (algorithme, niveau) pour le mode équilibré.
+# zstd domine le compromis vitesse/ratio sur le texte et les données
+# structurées (et profite du dictionnaire entraîné sur les petits contenus) ;
+# LZ4 reste le choix pour les données binaires et les gros objets sérialisés.
+_ADAPTIVE_STRATEGIES: Dict[Tuple[str, str], Tuple[CompressionAlgorithm, int]] = {
+    ("text", "small"): (CompressionAlgorithm.ZSTD, 9),
+    ("text", "medium"): (CompressionAlgorithm.ZSTD, 6),
+    ("text", "large"): (CompressionAlgorithm.ZSTD, 3),
+
+    ("json", "small"): (CompressionAlgorithm.ZSTD, 9),
+    ("json", "medium"): (CompressionAlgorithm.ZSTD, 6),
+    ("json", "large"): (CompressionAlgorithm.ZSTD, 3),
+
+    ("msgpack", "small"): (CompressionAlgorithm.ZSTD, 6),
+    ("msgpack", "medium"): (CompressionAlgorithm.ZSTD, 6),
+    ("msgpack", "large"): (CompressionAlgorithm.LZ4_BLOCK, 3),
+
+    ("pickle", "small"): (CompressionAlgorithm.ZSTD, 6),
+    ("pickle", "medium"): (CompressionAlgorithm.ZSTD, 6),
+    ("pickle", "large"): (CompressionAlgorithm.LZ4_BLOCK, 3),
+
+    ("bytes", "small"): (CompressionAlgorithm.LZ4, 3),
+    ("bytes", "medium"): (CompressionAlgorithm.LZ4, 3),
+    ("bytes", "large"): (CompressionAlgorithm.LZ4_BLOCK, 3),
+}
+
+
 class AdaptiveCompressor:
     """Compresseur adaptatif qui choisit automatiquement la meilleure stratégie."""
     
@@ -297,9 +757,42 @@ class AdaptiveCompressor:
                 "total_compressed_size": 0,
                 "avg_ratio": 1.0,
                 "avg_time_ms": 0.0,
+                "p95_time_ms": 0.0,
+                "cache_hits": 0,
             }
             for algorithm in CompressionAlgorithm
         }
+        # Derniers temps de compression par algorithme (fenêtre glissante pour le p95)
+        self._recent_times_ms: Dict[str, Deque[float]] = {
+            algorithm.value: deque(maxlen=RECENT_TIMES_WINDOW)
+            for algorithm in CompressionAlgorithm
+        }
+        # Échantillons récents (texte/JSON) pour entraîner le dictionnaire zstd
+        self._zstd_samples: Deque[bytes] = deque(maxlen=ZSTD_RETRAIN_INTERVAL)
+        self._compressions_since_training = 0
+        self._zstd_dict: zstd.ZstdCompressionDict = None
+        self._zstd_training = None
+    
+    def _maybe_retrain_dict(self) -> None:
+        """Entraîne un dictionnaire zstd en arrière-plan tous les N échantillons."""
+        # Installer le dictionnaire dont l'entraînement est terminé
+        if self._zstd_training is not None and self._zstd_training.done():
+            try:
+                dictionary = self._zstd_training.result()
+                _register_zstd_dictionary(dictionary)
+                self._zstd_dict = dictionary
+                logger.debug(f"Dictionnaire zstd entraîné: {dictionary.dict_id()}")
+            except zstd.ZstdError as e:
+                logger.debug(f"Entraînement du dictionnaire zstd impossible: {e}")
+            self._zstd_training = None
+        
+        if self._compressions_since_training < ZSTD_RETRAIN_INTERVAL or self._zstd_training is not None:
+            return
+        
+        self._compressions_since_training = 0
+        self._zstd_training = _bakeoff_pool.submit(
+            zstd.train_dictionary, ZSTD_DICT_SIZE, list(self._zstd_samples)
+        )
     
     def compress_adaptive(
         self,
@@ -318,36 +811,49 @@ class AdaptiveCompressor:
         Returns:
             CompressionResult: Résultat optimal
         """
-        import time
-        
-        data_size = len(str(data).encode('utf-8')) if not isinstance(data, bytes) else len(data)
+        # Sérialiser une seule fois : la taille mesurée est celle compressée
+        original_data, data_type = _to_bytes(data)
+        data_size = len(original_data)
         
-        # Stratégie selon les préférences et la taille
-        if prefer_speed or data_size > 10 * 1024 * 1024:  # > 10MB
-            # Privilégier LZ4 pour la vitesse
-            algorithm = CompressionAlgorithm.LZ4
-            level = 3
-        elif prefer_size or data_size < 100 * 1024:  # < 100KB
-            # Privilégier Brotli pour la taille
-            algorithm = CompressionAlgorithm.BROTLI
-            level = 8
+        # Stratégie selon les préférences, le type de contenu et la taille
+        if prefer_speed:
+            # Bloc LZ4 pour la vitesse
+            algorithm, level = CompressionAlgorithm.LZ4_BLOCK, 3
+        elif prefer_size and data_type != "bytes":
+            # Brotli pour la taille (préférence explicite : pas de sonde)
+            algorithm, level = CompressionAlgorithm.BROTLI, 8
+        elif _estimated_ratio(original_data) > INCOMPRESSIBLE_RATIO:
+            # Données incompressibles : inutile de payer un codec plus lent
+            algorithm, level = CompressionAlgorithm.LZ4_BLOCK, 3
         else:
-            # Équilibre avec GZIP
-            algorithm = CompressionAlgorithm.GZIP
-            level = 6
+            algorithm, level = _ADAPTIVE_STRATEGIES[(data_type, _size_bucket(data_size))]
         
         # Compresser et mesurer le temps
-        start_time = time.time()
-        result = compress_data(data, algorithm, level)
-        compression_time_ms = (time.time() - start_time) * 1000
+        start_ns = time.perf_counter_ns()
+        result = _compress_bytes_cached(original_data, data_type, algorithm, level, self._zstd_dict)
+        compression_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         # Mettre à jour les statistiques
         stats = self.compression_stats[algorithm.value]
         stats["uses"] += 1
+        if result.metadata.get("cache_hit"):
+            stats["cache_hits"] += 1
         stats["total_original_size"] += result.original_size
         stats["total_compressed_size"] += result.compressed_size
-        stats["avg_ratio"] = stats["total_compressed_size"] / stats["total_original_size"]
-        stats["avg_time_ms"] = (stats["avg_time_ms"] + compression_time_ms) / 2
+        if stats["total_original_size"] > 0:
+            stats["avg_ratio"] = stats["total_compressed_size"] / stats["total_original_size"]
+        # Moyenne cumulative exacte
+        stats["avg_time_ms"] += (compression_time_ms - stats["avg_time_ms"]) / stats["uses"]
+        
+        recent_times = self._recent_times_ms[algorithm.value]
+        recent_times.append(compression_time_ms)
+        ordered_times = sorted(recent_times)
+        stats["p95_time_ms"] = ordered_times[min(len(ordered_times) - 1, int(len(ordered_times) * 0.95))]
+        
+        if data_type in ("text", "json"):
+            self._zstd_samples.append(original_data[:ZSTD_SAMPLE_BYTES])
+            self._compressions_since_training += 1
+        self._maybe_retrain_dict()
         
         # Ajouter les métriques au résultat
         result.metadata.update({
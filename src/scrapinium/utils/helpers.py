@@ -3,7 +3,11 @@
 import hashlib
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import urlsplit
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def generate_task_id() -> str:
@@ -11,9 +15,10 @@ def generate_task_id() -> str:
     return str(uuid.uuid4())
 
 
+@lru_cache(maxsize=8192)
 def hash_url(url: str) -> str:
-    """Génère un hash pour une URL."""
-    return hashlib.md5(url.encode()).hexdigest()
+    """Génère un hash (32 caractères hexadécimaux) pour une URL."""
+    return hashlib.sha256(url.encode(), usedforsecurity=False).hexdigest()[:32]
 
 
 def format_timestamp(dt: datetime = None) -> str:
@@ -57,6 +62,7 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     return text[: max_length - len(suffix)] + suffix
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> Optional[str]:
     """
     Extrait le domaine d'une URL.
@@ -68,11 +74,8 @@ def extract_domain(url: str) -> Optional[str]:
         Nom de domaine ou None
     """
     try:
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        return parsed.netloc
-    except Exception:
+        return urlsplit(url).netloc
+    except ValueError:
         return None
 
 
@@ -106,6 +109,9 @@ def calculate_file_size(content: str) -> int:
     """
     if not content:
         return 0
+    # En ASCII, un caractère = un octet : pas besoin d'encoder une copie
+    if content.isascii():
+        return len(content)
     return len(content.encode("utf-8"))
 
 
@@ -119,18 +125,9 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Taille formatée (ex: "1.2 KB")
     """
-    if size_bytes == 0:
-        return "0 B"
-
-    units = ["B", "KB", "MB", "GB"]
-    size = float(size_bytes)
-    unit_index = 0
-
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    if size_bytes < 1024:
+        return f"{int(size_bytes)} B"
 
-    if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.1f} {units[unit_index]}"
+    # Chaque unité correspond à 10 bits : l'index se déduit de bit_length()
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
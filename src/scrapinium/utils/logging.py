@@ -2,8 +2,27 @@
 
 import logging
 import structlog
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Sérialise en JSON via orjson (le logger stdlib attend une str)."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """Renderer JSON, accéléré par orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer()
+
 
 def configure_logging(level: str = "INFO") -> None:
     """Configure le système de logging structuré."""
@@ -22,7 +41,7 @@ def configure_logging(level: str = "INFO") -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            _json_renderer(),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -31,8 +50,9 @@ def configure_logging(level: str = "INFO") -> None:
     )
 
 
+@lru_cache(maxsize=128)
 def get_logger(name: str) -> structlog.BoundLogger:
-    """Récupère un logger configuré."""
+    """Récupère un logger configuré (un seul proxy structlog par nom)."""
     return structlog.get_logger(name)
 
 
@@ -40,7 +60,8 @@ class PerformanceLogger:
     """Logger spécialisé pour les métriques de performance."""
     
     def __init__(self):
-        self.logger = get_logger("performance")
+        # Contexte commun lié une seule fois plutôt qu'à chaque événement
+        self.logger = get_logger("performance").bind(event_class="perf")
     
     def log_scraping_performance(self, metrics: Dict[str, Any]) -> None:
         """Log les métriques de performance de scraping."""
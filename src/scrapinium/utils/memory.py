@@ -6,32 +6,76 @@ import logging
 import time
 import tracemalloc
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Callable, Any
 from collections import defaultdict, deque
+from itertools import islice
 import psutil
 import os
+import sys
 
 from ..config import get_logger
 
 logger = get_logger("utils.memory")
 
+# Dataclasses sans __dict__ (slots=True n'existe qu'à partir de Python 3.10)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Allocateurs alternatifs détectables (LD_PRELOAD ou bibliothèque chargée)
+_KNOWN_ALLOCATORS = ("mimalloc", "jemalloc", "tcmalloc")
+
+
+@lru_cache(maxsize=1)
+def detect_allocator() -> str:
+    """
+    Identifie l'allocateur mémoire du processus.
+    
+    mimalloc/jemalloc (via LD_PRELOAD) remplacent malloc par des tas
+    par thread et des classes de taille plus fines : moins d'appels
+    brk/mmap et moins de contention, sans toucher au code applicatif.
+    
+    Returns:
+        Nom de l'allocateur ("mimalloc", "jemalloc", "tcmalloc",
+        "malloc" si PYTHONMALLOC=malloc, sinon "pymalloc")
+    """
+    preload = os.environ.get("LD_PRELOAD", "").lower()
+    for name in _KNOWN_ALLOCATORS:
+        if name in preload:
+            return name
+    
+    # Bibliothèque liée statiquement à l'interpréteur ou chargée autrement
+    try:
+        with open("/proc/self/maps", "r") as maps:
+            loaded = maps.read().lower()
+    except OSError:
+        loaded = ""
+    for name in _KNOWN_ALLOCATORS:
+        if f"lib{name}" in loaded:
+            return name
+    
+    if os.environ.get("PYTHONMALLOC", "").startswith("malloc"):
+        return "malloc"
+    return "pymalloc"
+
+
+@dataclass(**_SLOTS)
 class MemorySnapshot:
     """Instantané de l'utilisation mémoire."""
-    timestamp: float
+    timestamp: Optional[float]  # None = heure de création
     process_memory_mb: float
     system_memory_percent: float
-    gc_objects: int
+    gc_objects: int  # Compteurs de générations du GC (indicateur de pression, O(1))
     active_coroutines: int
     cache_size_mb: float = 0.0
     browser_contexts: int = 0
     
     def __post_init__(self):
-        self.timestamp = self.timestamp or time.time()
+        # Seul None déclenche le repli : un timestamp 0.0 explicite est conservé
+        if self.timestamp is None:
+            self.timestamp = time.time()
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class MemoryStats:
     """Statistiques mémoire globales."""
     current_usage_mb: float = 0.0
@@ -41,7 +85,15 @@ class MemoryStats:
     memory_warnings: int = 0
     oom_near_misses: int = 0
     cache_evictions: int = 0
-    snapshots: List[MemorySnapshot] = field(default_factory=list)
+    # Tampon circulaire : les plus anciens snapshots sont évincés en O(1)
+    snapshots: Deque[MemorySnapshot] = field(default_factory=lambda: deque(maxlen=100))
+    
+    def recent_snapshots(self, count: int) -> List[MemorySnapshot]:
+        """Retourne les `count` derniers snapshots (du plus ancien au plus récent)."""
+        # Parcours depuis la fin : O(count) quelle que soit la taille du tampon
+        recent = list(islice(reversed(self.snapshots), count))
+        recent.reverse()
+        return recent
     
     @property
     def usage_trend(self) -> str:
@@ -49,11 +101,9 @@ class MemoryStats:
         if len(self.snapshots) < 2:
             return "stable"
         
-        recent = self.snapshots[-5:]  # 5 derniers snapshots
-        if len(recent) < 2:
-            return "stable"
-            
-        trend = recent[-1].process_memory_mb - recent[0].process_memory_mb
+        # Comparer le plus ancien des 5 derniers snapshots au plus récent
+        oldest_recent = self.snapshots[max(0, len(self.snapshots) - 5)]
+        trend = self.snapshots[-1].process_memory_mb - oldest_recent.process_memory_mb
         if trend > 10:  # +10MB
             return "increasing"
         elif trend < -10:  # -10MB
@@ -70,24 +120,47 @@ class MemoryMonitor:
         warning_threshold_mb: float = 500.0,
         critical_threshold_mb: float = 1000.0,
         snapshot_interval: int = 30,
-        max_snapshots: int = 100
+        max_snapshots: int = 100,
+        min_gc_interval: float = 5.0
     ):
         self.warning_threshold_mb = warning_threshold_mb
         self.critical_threshold_mb = critical_threshold_mb
         self.snapshot_interval = snapshot_interval
         self.max_snapshots = max_snapshots
-        
-        self.stats = MemoryStats()
+        self.min_gc_interval = min_gc_interval
+        
+        self.stats = MemoryStats(snapshots=deque(maxlen=max_snapshots))
+        # Somme glissante des snapshots conservés (moyenne en O(1))
+        self._running_sum = 0.0
+        # Révision de l'historique : les tendances ne sont recalculées
+        # qu'après un nouveau snapshot
+        self._snapshot_rev = 0
+        self._trends_cache: Optional[Dict[str, Any]] = None
+        self._trends_cache_rev = -1
         self.callbacks: Dict[str, List[Callable]] = defaultdict(list)
         self.monitoring_active = False
         self._monitor_task: Optional[asyncio.Task] = None
         
-        # Historique des allocations
-        self.allocation_history = deque(maxlen=1000)
+        # Handle psutil réutilisé à chaque snapshot
+        self._process = psutil.Process(os.getpid())
         
-        # Activer tracemalloc pour le debug
+        # tracemalloc est coûteux sur chaque allocation : activé à la demande
+        self._tracing_owner = False
+        
+        # Horodatage (monotonic) du dernier GC forcé, pour ne pas les empiler
+        self._last_gc_ts: Optional[float] = None
+    
+    def enable_allocation_tracing(self, nframe: int = 1) -> None:
+        """Active tracemalloc (debug) si aucun autre composant ne l'a fait."""
         if not tracemalloc.is_tracing():
-            tracemalloc.start()
+            tracemalloc.start(nframe)
+            self._tracing_owner = True
+    
+    def disable_allocation_tracing(self) -> None:
+        """Arrête tracemalloc s'il a été démarré par ce moniteur."""
+        if self._tracing_owner and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._tracing_owner = False
     
     def add_callback(self, event: str, callback: Callable):
         """
@@ -99,8 +172,7 @@ class MemoryMonitor:
     
     def get_current_usage(self) -> MemorySnapshot:
         """Retourne un snapshot de l'utilisation mémoire actuelle."""
-        process = psutil.Process(os.getpid())
-        memory_info = process.memory_info()
+        memory_info = self._process.memory_info()
         
         # Mémoire du processus
         process_memory_mb = memory_info.rss / 1024 / 1024
@@ -109,14 +181,15 @@ class MemoryMonitor:
         system_memory = psutil.virtual_memory()
         system_memory_percent = system_memory.percent
         
-        # Objets Python
-        gc_objects = len(gc.get_objects())
+        # Objets Python en attente de collecte (gc.get_objects() matérialiserait
+        # la liste de tous les objets suivis à chaque snapshot)
+        gc_objects = sum(gc.get_count())
         
-        # Coroutines actives
-        active_coroutines = len([
-            task for task in asyncio.all_tasks() 
-            if not task.done()
-        ])
+        # Coroutines actives (all_tasks exclut déjà les tâches terminées)
+        try:
+            active_coroutines = len(asyncio.all_tasks())
+        except RuntimeError:
+            active_coroutines = 0  # Appel hors d'une boucle asyncio
         
         return MemorySnapshot(
             timestamp=time.time(),
@@ -135,18 +208,16 @@ class MemoryMonitor:
         if snapshot.process_memory_mb > self.stats.peak_usage_mb:
             self.stats.peak_usage_mb = snapshot.process_memory_mb
         
-        # Ajouter au snapshot
-        self.stats.snapshots.append(snapshot)
-        
-        # Limiter le nombre de snapshots
-        if len(self.stats.snapshots) > self.max_snapshots:
-            self.stats.snapshots.pop(0)
+        # Ajouter au snapshot (le deque borné évince le plus ancien)
+        snapshots = self.stats.snapshots
+        if len(snapshots) == snapshots.maxlen:
+            self._running_sum -= snapshots[0].process_memory_mb
+        self._running_sum += snapshot.process_memory_mb
+        snapshots.append(snapshot)
+        self._snapshot_rev += 1
         
-        # Calculer la moyenne
-        if self.stats.snapshots:
-            self.stats.average_usage_mb = sum(
-                s.process_memory_mb for s in self.stats.snapshots
-            ) / len(self.stats.snapshots)
+        # Moyenne glissante
+        self.stats.average_usage_mb = self._running_sum / len(snapshots)
         
         # Vérifier les seuils
         await self._check_thresholds(snapshot)
@@ -185,25 +256,34 @@ class MemoryMonitor:
             except Exception as e:
                 logger.error(f"Erreur callback mémoire {event}: {e}")
     
-    async def force_gc(self) -> int:
-        """Force un garbage collection et retourne le nombre d'objets collectés."""
-        before = len(gc.get_objects())
-        
-        # GC complet
-        collected = 0
-        for generation in range(3):
-            collected += gc.collect(generation)
+    async def force_gc(self, force: bool = False) -> int:
+        """
+        Force un garbage collection et retourne le nombre d'objets collectés.
         
-        after = len(gc.get_objects())
-        objects_freed = before - after
+        Les GC préventifs rapprochés (callbacks warning) sont ignorés pendant
+        `min_gc_interval` secondes ; `force` contourne cette limite (nettoyage
+        d'urgence, optimisation explicite).
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_gc_ts is not None
+            and now - self._last_gc_ts < self.min_gc_interval
+        ):
+            logger.debug("GC forcé ignoré (dernier il y a %.1fs)", now - self._last_gc_ts)
+            return 0
+        self._last_gc_ts = now
+        
+        # GC complet (la génération 2 inclut les plus jeunes)
+        collected = gc.collect()
         
         self.stats.gc_collections += 1
         
-        logger.info(f"🗑️  GC forcé: {objects_freed} objets libérés, {collected} collectés")
+        logger.info("🗑️  GC forcé: %d objets inaccessibles collectés", collected)
         
         await self._trigger_callbacks('gc_triggered', await self.take_snapshot())
         
-        return objects_freed
+        return collected
     
     async def optimize_memory(self) -> Dict[str, Any]:
         """Optimise l'utilisation mémoire avec plusieurs stratégies."""
@@ -219,7 +299,7 @@ class MemoryMonitor:
         }
         
         # 1. Garbage Collection forcé
-        gc_freed = await self.force_gc()
+        gc_freed = await self.force_gc(force=True)
         optimizations["gc_freed_objects"] = gc_freed
         optimizations["strategies_applied"].append("garbage_collection")
         
@@ -249,8 +329,8 @@ class MemoryMonitor:
         optimizations["memory_saved_mb"] = memory_saved
         
         logger.info(
-            f"✅ Optimisation terminée: {memory_saved:.1f}MB économisés, "
-            f"{len(optimizations['strategies_applied'])} stratégies"
+            "✅ Optimisation terminée: %.1fMB économisés, %d stratégies",
+            memory_saved, len(optimizations['strategies_applied'])
         )
         
         return optimizations
@@ -262,7 +342,7 @@ class MemoryMonitor:
         
         self.monitoring_active = True
         self._monitor_task = asyncio.create_task(self._monitor_loop())
-        logger.info(f"🔍 Surveillance mémoire démarrée (intervalle: {self.snapshot_interval}s)")
+        logger.info("🔍 Surveillance mémoire démarrée (intervalle: %ss)", self.snapshot_interval)
     
     async def stop_monitoring(self):
         """Arrête la surveillance."""
@@ -317,23 +397,38 @@ class MemoryMonitor:
                 "active": self.monitoring_active,
                 "snapshot_count": len(self.stats.snapshots),
                 "snapshot_interval": self.snapshot_interval,
-            }
+            },
+            "allocator": detect_allocator(),
         }
         
         # Analyse des tendances
         if len(self.stats.snapshots) >= 2:
-            recent_snapshots = self.stats.snapshots[-10:]  # 10 derniers
-            memory_values = [s.process_memory_mb for s in recent_snapshots]
-            
-            report["trends"] = {
-                "min_recent": min(memory_values),
-                "max_recent": max(memory_values),
-                "volatility": max(memory_values) - min(memory_values),
-                "direction": self.stats.usage_trend,
-            }
+            report["trends"] = self._get_trends()
         
         return report
     
+    def _get_trends(self) -> Dict[str, Any]:
+        """Tendances des derniers snapshots, mises en cache par révision."""
+        if self._trends_cache_rev == self._snapshot_rev and self._trends_cache is not None:
+            return dict(self._trends_cache)
+        
+        recent_snapshots = self.stats.recent_snapshots(10)  # 10 derniers
+        min_recent = max_recent = recent_snapshots[0].process_memory_mb
+        for s in recent_snapshots:
+            if s.process_memory_mb < min_recent:
+                min_recent = s.process_memory_mb
+            elif s.process_memory_mb > max_recent:
+                max_recent = s.process_memory_mb
+        
+        self._trends_cache = {
+            "min_recent": min_recent,
+            "max_recent": max_recent,
+            "volatility": max_recent - min_recent,
+            "direction": self.stats.usage_trend,
+        }
+        self._trends_cache_rev = self._snapshot_rev
+        return dict(self._trends_cache)
+    
     def get_detailed_stats(self) -> dict:
         """Statistiques mémoire détaillées pour l'API."""
         return self.get_memory_report()
@@ -344,7 +439,7 @@ class MemoryMonitor:
         
         try:
             # 1. GC agressif
-            await self.force_gc()
+            await self.force_gc(force=True)
             
             # 2. Déclencher les callbacks de nettoyage
             await self._trigger_callbacks('cleanup_needed', await self.take_snapshot())
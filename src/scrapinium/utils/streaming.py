@@ -1,29 +1,163 @@
 """Traitement en streaming pour optimiser la mémoire."""
 
 import asyncio
+import codecs
 import io
-from typing import AsyncGenerator, Optional, Union, Dict, Any
+import os
+from collections import deque
+from typing import AsyncGenerator, ClassVar, Deque, Optional, Union, Dict, Any, List
 from dataclasses import dataclass
 import gzip
 import json
 
 from ..config import get_logger
 
+# zlib-ng (DEFLATE vectorisé) si disponible, sinon stdlib
+try:
+    from zlib_ng import zlib_ng as zlib
+except ImportError:
+    import zlib
+
+# Sérialiseur JSON natif (repli sur json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# zstd : ~3x plus rapide que gzip à ratio équivalent (repli sur gzip)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Parser HTML incrémental en C (repli sur BeautifulSoup chunk par chunk)
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 logger = get_logger("utils.streaming")
 
+# Au-delà de cette taille, la compression part dans un thread pour ne pas
+# bloquer la boucle asyncio (les codecs C libèrent le GIL)
+OFFLOAD_THRESHOLD = 256 * 1024
+
+# Nombre de chunks émis entre deux rendus de main à la boucle asyncio
+YIELD_EVERY_CHUNKS = 8
+
+# Tampon d'écriture de stream_to_file (regroupe les petits chunks compressés)
+FILE_WRITE_BUFFER = 1 << 20
+
+# Signatures de formats déjà compressés : gzip, JPEG, PNG, GIF
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"\xff\xd8\xff", b"\x89PNG", b"GIF8")
+
+
+def _store_compress(serialized: bytes) -> bytes:
+    """Compresse un contenu texte pour le stockage (zstd niveau 3, sinon gzip)."""
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=3).compress(serialized)
+    return gzip.compress(serialized, 6)
+
 
 @dataclass
 class StreamChunk:
     """Chunk de données en streaming."""
-    data: bytes
+    data: bytes  # memoryview uniquement pour les chunks internes recyclés (voir `acquire`)
     size: int
     chunk_id: int
     is_final: bool = False
     metadata: Optional[Dict[str, Any]] = None
     
+    # Chunks rendus par les consommateurs internes, réutilisés par `acquire`
+    _pool: ClassVar[Deque["StreamChunk"]] = deque(maxlen=256)
+    
     def __post_init__(self):
         if self.size == 0:
             self.size = len(self.data)
+    
+    @classmethod
+    def acquire(
+        cls,
+        data: Union[bytes, memoryview],
+        size: int,
+        chunk_id: int,
+        is_final: bool = False,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> "StreamChunk":
+        """Retourne un chunk recyclé depuis le pool, ou un nouveau chunk."""
+        try:
+            chunk = cls._pool.pop()
+        except IndexError:
+            return cls(data, size, chunk_id, is_final, metadata)
+        
+        chunk.data = data
+        chunk.size = size
+        chunk.chunk_id = chunk_id
+        chunk.is_final = is_final
+        chunk.metadata = metadata
+        return chunk
+    
+    def release(self) -> None:
+        """Rend le chunk au pool (ne plus l'utiliser ensuite)."""
+        self.data = b""
+        self.metadata = None
+        StreamChunk._pool.append(self)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Sérialise en JSON UTF-8, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Cas non gérés par orjson (ex: entiers > 64 bits)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+class _TextCollector:
+    """Cible lxml qui accumule le texte au fil du parsing incrémental."""
+    
+    # Contenus non textuels ignorés (comme BeautifulSoup.get_text)
+    SKIPPED_TAGS = frozenset({"script", "style", "template"})
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self._pending: List[str] = []
+        self._skip_depth = 0
+    
+    def _flush(self) -> None:
+        # Un nœud texte peut arriver en plusieurs morceaux (frontières de feed)
+        text = "".join(self._pending).strip()
+        self._pending.clear()
+        if text:
+            self.parts.append(text)
+    
+    def start(self, tag, attrib) -> None:
+        self._flush()
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+    
+    def end(self, tag) -> None:
+        self._flush()
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._pending.append(data)
+    
+    def close(self) -> None:
+        self._flush()
+    
+    def drain(self) -> str:
+        """Retourne le texte accumulé depuis le dernier appel."""
+        text = " ".join(self.parts)
+        self.parts.clear()
+        return text
 
 
 class StreamingProcessor:
@@ -37,59 +171,80 @@ class StreamingProcessor:
     async def process_content_stream(
         self, 
         content: Union[str, bytes], 
-        max_size: Optional[int] = None
+        max_size: Optional[int] = None,
+        include_metadata: bool = False
     ) -> AsyncGenerator[StreamChunk, None]:
         """
         Traite le contenu par chunks pour éviter la surcharge mémoire.
         
+        Les chunks produits possèdent leurs données (`bytes`) et peuvent être
+        conservés par l'appelant.
+        
         Args:
             content: Contenu à traiter
             max_size: Taille maximale à traiter (None = illimité)
+            include_metadata: Joindre la progression à chaque chunk
         
         Yields:
             StreamChunk: Chunks de données
         """
+        async for chunk in self._stream_chunks(content, max_size, include_metadata, views=False):
+            yield chunk
+    
+    async def _stream_chunks(
+        self,
+        content: Union[str, bytes],
+        max_size: Optional[int] = None,
+        include_metadata: bool = False,
+        views: bool = True
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """
+        Découpe le contenu en chunks ; avec `views`, chunks recyclés sans copie.
+        
+        Les chunks `views` portent une memoryview sur le contenu source et
+        doivent être rendus (`release`) puis abandonnés par le consommateur :
+        réservé aux consommateurs internes.
+        """
         if isinstance(content, str):
             content = content.encode('utf-8')
         
-        total_size = len(content)
+        # Les chunks sont des tranches d'une même vue : aucune copie par chunk
+        view = memoryview(content)
+        total_size = len(view)
         
         # Limiter la taille si spécifié
         if max_size and total_size > max_size:
             logger.warning(f"Contenu tronqué: {total_size} > {max_size} bytes")
-            content = content[:max_size]
+            view = view[:max_size]
             total_size = max_size
         
-        chunk_id = 0
-        bytes_processed = 0
+        chunk_size = self.chunk_size
+        last_chunk_id = (total_size + chunk_size - 1) // chunk_size - 1
         
         # Traiter par chunks
-        for i in range(0, total_size, self.chunk_size):
-            chunk_data = content[i:i + self.chunk_size]
-            bytes_processed += len(chunk_data)
-            
-            is_final = bytes_processed >= total_size
+        for chunk_id, start in enumerate(range(0, total_size, chunk_size)):
+            end = min(start + chunk_size, total_size)
             
-            chunk = StreamChunk(
-                data=chunk_data,
-                size=len(chunk_data),
-                chunk_id=chunk_id,
-                is_final=is_final,
-                metadata={
-                    "progress": bytes_processed / total_size,
+            chunk = (StreamChunk.acquire if views else StreamChunk)(
+                view[start:end] if views else view[start:end].tobytes(),
+                end - start,
+                chunk_id,
+                chunk_id == last_chunk_id,
+                {
+                    "progress": end / total_size,
                     "total_size": total_size,
-                    "bytes_processed": bytes_processed,
-                }
+                    "bytes_processed": end,
+                } if include_metadata else None
             )
             
-            self.processed_bytes += len(chunk_data)
+            self.processed_bytes += end - start
             self.total_chunks += 1
-            chunk_id += 1
             
             yield chunk
             
-            # Yielder le contrôle pour éviter de bloquer
-            await asyncio.sleep(0)
+            # Yielder le contrôle périodiquement pour éviter de bloquer
+            if chunk_id % YIELD_EVERY_CHUNKS == YIELD_EVERY_CHUNKS - 1:
+                await asyncio.sleep(0)
     
     async def extract_text_streaming(
         self, 
@@ -106,15 +261,59 @@ class StreamingProcessor:
         Yields:
             str: Portions de texte extraites
         """
+        if not LXML_AVAILABLE:
+            async for text in self._extract_text_bs4(html_content, max_size):
+                yield text
+            return
+        
+        # Un seul parser pour tout le document : l'état est conservé entre
+        # les chunks (balises et caractères UTF-8 coupés aux frontières)
+        collector = _TextCollector()
+        parser = etree.HTMLParser(target=collector, encoding='utf-8')
+        
+        async for chunk in self._stream_chunks(html_content, max_size):
+            try:
+                parser.feed(bytes(chunk.data))  # lxml n'accepte pas les memoryview
+            except etree.LxmlError as e:
+                logger.warning(f"Erreur extraction chunk {chunk.chunk_id}: {e}")
+                continue
+            finally:
+                chunk.release()
+            
+            text = collector.drain()
+            if text:
+                yield text
+        
+        try:
+            parser.close()
+        except etree.LxmlError as e:
+            logger.warning(f"Erreur fin d'extraction: {e}")
+        
+        text = collector.drain()
+        if text:
+            yield text
+    
+    async def _extract_text_bs4(
+        self, 
+        html_content: str, 
+        max_size: int
+    ) -> AsyncGenerator[str, None]:
+        """Extraction de repli avec BeautifulSoup, chunk par chunk."""
         try:
             from bs4 import BeautifulSoup
         except ImportError:
             logger.error("BeautifulSoup non disponible pour l'extraction streaming")
             return
         
+        # Décodeur incrémental : les caractères coupés entre deux chunks
+        # sont réassemblés au lieu d'être perdus
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
         # Traiter par chunks pour éviter de charger tout en mémoire
-        async for chunk in self.process_content_stream(html_content, max_size):
-            chunk_html = chunk.data.decode('utf-8', errors='ignore')
+        async for chunk in self._stream_chunks(html_content, max_size):
+            chunk_html = decoder.decode(chunk.data, final=chunk.is_final)
+            chunk_id = chunk.chunk_id
+            chunk.release()
             
             try:
                 # Parser avec BeautifulSoup (mode partiel)
@@ -127,7 +326,7 @@ class StreamingProcessor:
                     yield text
                     
             except Exception as e:
-                logger.warning(f"Erreur extraction chunk {chunk.chunk_id}: {e}")
+                logger.warning(f"Erreur extraction chunk {chunk_id}: {e}")
                 continue
             
             # Yielder le contrôle
@@ -172,7 +371,7 @@ class ContentStreamer:
         
         # Sérialiser selon le type
         if content_type == "json" and isinstance(content, dict):
-            content_bytes = json.dumps(content, ensure_ascii=False).encode('utf-8')
+            content_bytes = _dumps(content)
         elif isinstance(content, str):
             content_bytes = content.encode('utf-8')
         elif isinstance(content, bytes):
@@ -182,12 +381,28 @@ class ContentStreamer:
         
         # Compression si activée et si le contenu est assez volumineux
         if should_compress and len(content_bytes) > 1024:  # > 1KB
-            content_bytes = gzip.compress(content_bytes)
-            logger.debug(f"Contenu compressé: {len(content_bytes)} bytes")
+            # Compression incrémentale au format gzip (wbits=31) : la sortie
+            # est émise au fil de l'eau, sans copie compressée complète
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            compressed_size = 0
+            async for chunk in self.processor._stream_chunks(content_bytes):
+                compressed = compressor.compress(chunk.data)
+                chunk.release()
+                if compressed:
+                    compressed_size += len(compressed)
+                    yield compressed
+            tail = compressor.flush()
+            compressed_size += len(tail)
+            if tail:
+                yield tail
+            logger.debug("Contenu compressé: %d bytes", compressed_size)
+            return
         
         # Streamer par chunks
-        async for chunk in self.processor.process_content_stream(content_bytes):
-            yield chunk.data
+        async for chunk in self.processor._stream_chunks(content_bytes):
+            data = bytes(chunk.data)
+            chunk.release()
+            yield data
             
             # Yielder le contrôle
             await asyncio.sleep(0)
@@ -215,21 +430,28 @@ class ContentStreamer:
             int: Nombre de bytes écrits
         """
         bytes_written = 0
+        chunk_count = 0
         
         try:
-            with open(filepath, 'wb') as f:
+            with open(filepath, 'wb', buffering=FILE_WRITE_BUFFER) as f:
+                if hasattr(os, "posix_fadvise"):
+                    # Écriture séquentielle : indication au cache de pages
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
                 async for chunk in stream:
                     f.write(chunk)
                     bytes_written += len(chunk)
+                    chunk_count += 1
                     
-                    # Yielder le contrôle après chaque chunk
-                    await asyncio.sleep(0)
+                    # Yielder le contrôle périodiquement
+                    if chunk_count % YIELD_EVERY_CHUNKS == 0:
+                        await asyncio.sleep(0)
                     
         except Exception as e:
             logger.error(f"Erreur écriture fichier {filepath}: {e}")
             raise
         
-        logger.info(f"Stream écrit dans {filepath}: {bytes_written} bytes")
+        logger.info("Stream écrit dans %s: %d bytes", filepath, bytes_written)
         return bytes_written
     
     async def stream_response(
@@ -314,37 +536,31 @@ class MemoryEfficientProcessor:
         result["metadata"]["processed_size"] = len(html_content)
         
         try:
-            from bs4 import BeautifulSoup
-            
-            # Parser avec limite mémoire
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
             # Extraction de texte en streaming si demandé
             if extract_text:
-                text_chunks = []
+                # Texte écrit au fil de l'eau (pas de liste de chunks à joindre)
+                text_buf = io.StringIO()
+                current_text_size = 0
                 processor = StreamingProcessor(chunk_size=32 * 1024)  # 32KB chunks
                 
                 async for text_chunk in processor.extract_text_streaming(html_content, max_size):
-                    text_chunks.append(text_chunk)
+                    if current_text_size:
+                        text_buf.write(" ")
+                        current_text_size += 1
+                    text_buf.write(text_chunk)
                     
-                    # Vérifier la mémoire
-                    current_text_size = sum(len(chunk) for chunk in text_chunks)
+                    # Vérifier la mémoire (compteur cumulé, sans re-sommer les chunks)
+                    current_text_size += len(text_chunk)
                     if current_text_size > max_size // 2:  # Max 50% pour le texte
                         logger.warning("Limite mémoire texte atteinte")
                         break
                 
-                result["text_content"] = " ".join(text_chunks)
+                result["text_content"] = text_buf.getvalue()
+                text_buf.close()
             
             # Extraction de liens (plus efficace)
             if extract_links:
-                links = []
-                for link in soup.find_all('a', href=True, limit=100):  # Limiter à 100 liens
-                    links.append({
-                        "href": link['href'],
-                        "text": link.get_text(strip=True)[:100],  # Limiter le texte
-                    })
-                
-                result["links"] = links
+                result["links"] = self._extract_links(html_content, limit=100)
                 
         except Exception as e:
             logger.error(f"Erreur traitement HTML efficace: {e}")
@@ -353,6 +569,39 @@ class MemoryEfficientProcessor:
         
         return result
     
+    def _extract_links(self, html_content: str, limit: int = 100) -> List[Dict[str, str]]:
+        """Extrait les `limit` premiers liens (XPath lxml, repli BeautifulSoup)."""
+        if not html_content.strip():
+            return []
+        
+        if LXML_AVAILABLE:
+            # Encodage imposé : une déclaration dans le document ne doit pas
+            # changer l'interprétation de la chaîne déjà décodée
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            try:
+                root = lxml.html.fromstring(html_content.encode('utf-8'), parser=parser)
+            except etree.ParserError:
+                return []  # Document sans élément (ex: uniquement un commentaire)
+            anchors = root.xpath(f'(//a[@href])[position() <= {int(limit)}]')
+            return [
+                {
+                    "href": anchor.get('href'),
+                    "text": anchor.text_content().strip()[:100],  # Limiter le texte
+                }
+                for anchor in anchors
+            ]
+        
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html_content, 'html.parser')
+        return [
+            {
+                "href": link['href'],
+                "text": link.get_text(strip=True)[:100],  # Limiter le texte
+            }
+            for link in soup.find_all('a', href=True, limit=limit)
+        ]
+    
     async def compress_and_store(
         self, 
         data: Any, 
@@ -372,19 +621,26 @@ class MemoryEfficientProcessor:
         """
         # Sérialiser
         if isinstance(data, dict):
-            serialized = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            serialized = _dumps(data)
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            serialized = bytes(data)
         else:
             serialized = str(data).encode('utf-8')
         
         original_size = len(serialized)
+        codec = "zstd" if ZSTD_AVAILABLE else "gzip"
         
-        # Compresser si > 1KB
-        if original_size > 1024:
-            compressed = gzip.compress(serialized)
-            compression_ratio = len(compressed) / original_size
-        else:
+        # Compresser si > 1KB et pas déjà dans un format compressé
+        if original_size <= 1024 or serialized.startswith(_COMPRESSED_MAGIC):
             compressed = serialized
             compression_ratio = 1.0
+            codec = "none"
+        elif original_size > OFFLOAD_THRESHOLD:
+            compressed = await asyncio.to_thread(_store_compress, serialized)
+            compression_ratio = len(compressed) / original_size
+        else:
+            compressed = _store_compress(serialized)
+            compression_ratio = len(compressed) / original_size
         
         storage_info = {
             "key": storage_key,
@@ -393,11 +649,12 @@ class MemoryEfficientProcessor:
             "compression_ratio": compression_ratio,
             "backend": storage_backend,
             "compressed": compression_ratio < 1.0,
+            "codec": codec,
         }
         
         logger.debug(
-            f"Données compressées: {original_size} -> {len(compressed)} bytes "
-            f"(ratio: {compression_ratio:.2f})"
+            "Données compressées: %d -> %d bytes (ratio: %.2f)",
+            original_size, len(compressed), compression_ratio
         )
         
         return storage_info
\ No newline at end of file
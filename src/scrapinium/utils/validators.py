@@ -1,8 +1,24 @@
 """Validators pour Scrapinium."""
 
 import re
-from typing import Optional
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import List, Optional, Union
+from urllib.parse import urlsplit
+
+_ALLOWED_SCHEMES = frozenset(("http", "https"))
+
+# Protocoles explicitement dangereux (message d'erreur dédié)
+_FORBIDDEN_SCHEMES = frozenset({"javascript", "data", "file", "ftp", "vbscript"})
+
+# Caractères interdits dans un nom de fichier (table de traduction C)
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# URL http(s) ASCII sans ambiguïté : toute URL qui matche est valide pour
+# validate_url (les autres repassent par la validation complète)
+_URL_RE = re.compile(
+    r"https?://[A-Za-z0-9.\-_~%!$&'()*+,;=:@]{1,253}(?:[/?#][!-~]*)?",
+    re.ASCII,
+)
 
 
 def validate_url(url: str) -> tuple[bool, Optional[str]]:
@@ -15,46 +31,62 @@ def validate_url(url: str) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple (is_valid, error_message)
     """
-    if not url or not url.strip():
+    if not url or not (url := url.strip()):
         return False, "URL vide"
 
-    url = url.strip()
+    # Vérifier la longueur avant de parser (rejette les entrées énormes en O(1))
+    if len(url) > 2048:
+        return False, "URL trop longue (max 2048 caractères)"
+
+    return _validate_stripped_url(url)
+
 
+@lru_cache(maxsize=1024)
+def _validate_stripped_url(url: str) -> tuple[bool, Optional[str]]:
+    """Validation du format d'une URL déjà nettoyée (pure, donc mémoïsée)."""
     # Vérifier le format
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
 
         if not parsed.scheme:
             return False, "Protocole manquant (http/https)"
 
-        if parsed.scheme not in ["http", "https"]:
+        # urlsplit normalise déjà le schéma en minuscules
+        if parsed.scheme in _FORBIDDEN_SCHEMES:
+            return False, "Protocole non autorisé détecté"
+
+        if parsed.scheme not in _ALLOWED_SCHEMES:
             return False, "Protocole non supporté (seuls http/https sont acceptés)"
 
         if not parsed.netloc:
             return False, "Nom de domaine manquant"
 
-        # Vérifier la longueur
-        if len(url) > 2048:
-            return False, "URL trop longue (max 2048 caractères)"
-
-        # Vérifier les caractères dangereux
-        dangerous_patterns = [
-            r"javascript:",
-            r"data:",
-            r"file:",
-            r"ftp:",
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, url.lower()):
-                return False, "Protocole non autorisé détecté"
-
         return True, None
 
     except Exception as e:
         return False, f"Format d'URL invalide: {str(e)}"
 
 
+def validate_urls(urls: List[str]) -> List[tuple[bool, Optional[str]]]:
+    """
+    Valide un lot d'URLs.
+
+    Les URLs simples sont acceptées par une seule regex compilée ; seules
+    les autres passent par `validate_url`.
+
+    Args:
+        urls: URLs à valider
+
+    Returns:
+        Liste de tuples (is_valid, error_message), dans l'ordre des URLs
+    """
+    fast_match = _URL_RE.fullmatch
+    return [
+        (True, None) if len(url) <= 2048 and fast_match(url) else validate_url(url)
+        for url in urls
+    ]
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Nettoie un nom de fichier.
@@ -66,36 +98,38 @@ def sanitize_filename(filename: str) -> str:
         Nom de fichier sécurisé
     """
     # Remplacer les caractères dangereux
-    safe_filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    safe_filename = filename.translate(_SANITIZE_TABLE).strip()
 
     # Limiter la longueur
     if len(safe_filename) > 255:
-        safe_filename = safe_filename[:255]
+        safe_filename = safe_filename[:255].rstrip()
 
     # S'assurer qu'il n'est pas vide
-    if not safe_filename.strip():
-        safe_filename = "untitled"
-
-    return safe_filename.strip()
+    return safe_filename or "untitled"
 
 
 def validate_content_length(
-    content: str, max_length: int = 100000
+    content: Union[str, bytes], max_length: int = 100000
 ) -> tuple[bool, Optional[str]]:
     """
     Valide la longueur du contenu.
 
+    Les bytes (ex: `response.content`) sont mesurés directement, sans
+    décodage UTF-8 préalable.
+
     Args:
-        content: Contenu à valider
-        max_length: Longueur maximale autorisée
+        content: Contenu à valider (texte ou bytes)
+        max_length: Longueur maximale autorisée (caractères ou octets)
 
     Returns:
         Tuple (is_valid, error_message)
     """
-    if not content:
+    length = len(content) if content else 0
+    if not length:
         return False, "Contenu vide"
 
-    if len(content) > max_length:
-        return False, f"Contenu trop long ({len(content)} > {max_length} caractères)"
+    if length > max_length:
+        unit = "octets" if isinstance(content, (bytes, bytearray)) else "caractères"
+        return False, f"Contenu trop long ({length} > {max_length} {unit})"
 
     return True, None
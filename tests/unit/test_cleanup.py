@@ -0,0 +1,306 @@
+"""Tests du nettoyage automatique des ressources."""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+from scrapinium.utils.cleanup import (
+    AccessTracker,
+    CleanupRule,
+    ResourceCleaner,
+    ResourceTracker,
+    ResourceType,
+)
+
+
+@pytest.mark.unit
+class TestCleanupCallbacks:
+    """Tests des callbacks de nettoyage personnalisés."""
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_concurrently(self):
+        """Les callbacks async sont exécutés en parallèle et agrégés."""
+        cleaner = ResourceCleaner(max_concurrent_callbacks=4)
+
+        async def slow_callback(rule):
+            await asyncio.sleep(0.1)
+            return {"items_cleaned": 1, "bytes_freed": 10}
+
+        for _ in range(4):
+            cleaner.add_cleanup_callback(ResourceType.CACHE, slow_callback)
+
+        rule = CleanupRule(
+            resource_type=ResourceType.CACHE,
+            condition="count",
+            threshold=0,
+            action="clean",
+        )
+
+        start = time.perf_counter()
+        result = await cleaner.run_cleanup_rule(rule)
+        elapsed = time.perf_counter() - start
+
+        assert result.success
+        assert result.items_cleaned == 4
+        assert result.bytes_freed == 40
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_block_others(self):
+        """Une exception dans un callback n'empêche pas les autres."""
+        cleaner = ResourceCleaner()
+
+        def failing_callback(rule):
+            raise RuntimeError("boom")
+
+        def sync_callback(rule):
+            return {"items_cleaned": 2, "bytes_freed": 0}
+
+        cleaner.add_cleanup_callback(ResourceType.CONNECTIONS, failing_callback)
+        cleaner.add_cleanup_callback(ResourceType.CONNECTIONS, sync_callback)
+
+        rule = CleanupRule(
+            resource_type=ResourceType.CONNECTIONS,
+            condition="count",
+            threshold=0,
+            action="clean",
+        )
+        result = await cleaner.run_cleanup_rule(rule)
+
+        assert result.success
+        assert result.items_cleaned == 2
+
+
+@pytest.mark.unit
+class TestTempFilesCleanup:
+    """Tests du nettoyage des fichiers temporaires."""
+
+    @pytest.mark.asyncio
+    async def test_old_prefixed_files_removed(self, tmp_path, monkeypatch):
+        """Seuls les fichiers préfixés et anciens sont supprimés."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        old_file = tmp_path / "scrapinium_old.tmp"
+        old_file.write_bytes(b"x" * 128)
+        other_file = tmp_path / "other.tmp"
+        other_file.write_bytes(b"y")
+        (tmp_path / "scrapinium_dir").mkdir()
+
+        monkeypatch.setattr(cleanup_module.tempfile, "gettempdir", lambda: str(tmp_path))
+        future = time.time() + 3 * 3600
+        monkeypatch.setattr(cleanup_module.time, "time", lambda: future)
+
+        result = await ResourceCleaner().cleanup_temp_files()
+
+        assert result.success
+        assert result.items_cleaned == 1
+        assert result.bytes_freed == 128
+        assert not old_file.exists()
+        assert other_file.exists()
+        assert (tmp_path / "scrapinium_dir").exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_tracked_dir_is_forgotten(self, tmp_path, monkeypatch):
+        """Un dossier tracké déjà supprimé est retiré du tracking."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        monkeypatch.setattr(cleanup_module.tempfile, "gettempdir", lambda: str(tmp_path))
+        cleaner = ResourceCleaner()
+        cleaner.track_temp_directory(str(tmp_path / "gone"))
+
+        result = await cleaner.cleanup_temp_files()
+
+        assert result.success
+        assert cleaner.temp_dirs == set()
+
+    @pytest.mark.asyncio
+    async def test_rule_threshold_controls_max_age(self, tmp_path, monkeypatch):
+        """L'âge maximal vient du seuil de la règle TEMP_FILES."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        temp_file = tmp_path / "scrapinium_recent.tmp"
+        temp_file.write_bytes(b"x")
+        monkeypatch.setattr(cleanup_module.tempfile, "gettempdir", lambda: str(tmp_path))
+
+        rule = CleanupRule(
+            resource_type=ResourceType.TEMP_FILES,
+            condition="age",
+            threshold=60,
+            action="delete",
+        )
+        cleaner = ResourceCleaner()
+
+        result = await cleaner.cleanup_temp_files(rule, now=time.time() + 30)
+        assert result.items_cleaned == 0
+
+        result = await cleaner.cleanup_temp_files(rule, now=time.time() + 120)
+        assert result.items_cleaned == 1
+        assert not temp_file.exists()
+
+    def test_directory_size_is_recursive(self, tmp_path):
+        """La taille d'un dossier inclut ses sous-dossiers."""
+        (tmp_path / "a.bin").write_bytes(b"x" * 10)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.bin").write_bytes(b"y" * 20)
+
+        assert ResourceCleaner()._get_directory_size(str(tmp_path)) == 30
+
+
+class _Resource:
+    """Objet factice supportant les weak references."""
+
+
+@pytest.mark.unit
+class TestResourceTracker:
+    """Tests du trackeur de ressources."""
+
+    def test_collected_objects_are_forgotten(self):
+        """Les objets collectés disparaissent du tracking et des métadonnées."""
+        tracker = ResourceTracker()
+        kept = _Resource()
+        dropped = _Resource()
+        tracker.track_resource(kept, ResourceType.CACHE, size_bytes=100)
+        tracker.track_resource(dropped, ResourceType.CACHE, size_bytes=50)
+
+        del dropped
+        gc.collect()
+
+        stats = tracker.get_resource_stats()[ResourceType.CACHE.value]
+        assert stats["count"] == 1
+        assert stats["total_size_bytes"] == 100
+        assert len(tracker.tracked_objects[ResourceType.CACHE.value]) == 1
+
+    def test_find_old_resources(self, monkeypatch):
+        """Seules les ressources plus anciennes que le seuil sont retournées."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        tracker = ResourceTracker()
+        resource = _Resource()
+        tracker.track_resource(resource, ResourceType.BROWSER_CONTEXTS)
+
+        assert tracker.find_old_resources(max_age_seconds=60) == {}
+
+        later = time.monotonic() + 120
+        monkeypatch.setattr(cleanup_module.time, "monotonic", lambda: later)
+        old = tracker.find_old_resources(max_age_seconds=60)
+        assert old == {ResourceType.BROWSER_CONTEXTS: [resource]}
+
+    def test_find_old_resources_stops_at_young_entries(self, monkeypatch):
+        """Les ressources retouchées repassent en fin d'index."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        tracker = ResourceTracker()
+        first, second = _Resource(), _Resource()
+        tracker.track_resource(first, ResourceType.TASKS)
+        tracker.track_resource(second, ResourceType.TASKS)
+
+        later = time.monotonic() + 120
+        monkeypatch.setattr(cleanup_module.time, "monotonic", lambda: later)
+        tracker.touch(first, ResourceType.TASKS)
+
+        old = tracker.find_old_resources(max_age_seconds=60)
+        assert old == {ResourceType.TASKS: [second]}
+
+    def test_find_old_resources_only_visits_expired_entries(self, monkeypatch):
+        """La recherche s'arrête à la première ressource trop jeune."""
+        import scrapinium.utils.cleanup as cleanup_module
+
+        clock = [1000.0]
+        monkeypatch.setattr(cleanup_module.time, "monotonic", lambda: clock[0])
+
+        tracker = ResourceTracker()
+        resources = []
+        for _ in range(100):
+            resource = _Resource()
+            resources.append(resource)
+            tracker.track_resource(resource, ResourceType.CACHE)
+            clock[0] += 1
+
+        visited = []
+
+        class _CountingEntry(tuple):
+            def __iter__(self):
+                visited.append(self)
+                return super().__iter__()
+
+        entries = tracker.tracked_objects[ResourceType.CACHE.value]
+        for resource in resources:
+            entries[resource] = _CountingEntry(entries[resource])
+
+        old = tracker.find_old_resources(max_age_seconds=95)
+
+        assert old == {ResourceType.CACHE: resources[:5]}
+        assert len(visited) == 6  # 5 expirées + la première trop jeune
+
+
+@pytest.mark.unit
+class TestCleanupScheduling:
+    """Tests du filtrage des règles selon leurs seuils."""
+
+    @pytest.mark.asyncio
+    async def test_idle_system_skips_rules(self, monkeypatch):
+        """Aucune règle n'est exécutée si aucun seuil n'est atteint."""
+        cleaner = ResourceCleaner()
+        monkeypatch.setattr(cleaner, "_collect_indicators", lambda: {
+            "rss_mb": 10.0,
+            "tracked_counts": {rt.value: 0 for rt in ResourceType},
+        })
+
+        results = await cleaner.run_all_cleanup_rules()
+
+        assert results == []
+        assert all(rule.success_count == 0 for rule in cleaner.rules)
+
+    @pytest.mark.asyncio
+    async def test_breached_threshold_runs_rule(self, monkeypatch):
+        """Une règle dont le seuil est dépassé est exécutée."""
+        cleaner = ResourceCleaner()
+        counts = {rt.value: 0 for rt in ResourceType}
+        counts[ResourceType.TASKS.value] = 500
+        monkeypatch.setattr(cleaner, "_collect_indicators", lambda: {
+            "rss_mb": 10.0,
+            "tracked_counts": counts,
+        })
+
+        results = await cleaner.run_all_cleanup_rules()
+
+        assert [r.resource_type for r in results] == [ResourceType.TASKS]
+
+
+@pytest.mark.unit
+class TestMemoryCleanup:
+    """Tests du nettoyage mémoire."""
+
+    def test_rss_is_positive(self):
+        """La lecture du RSS retourne une valeur cohérente."""
+        cleaner = ResourceCleaner()
+        assert cleaner._get_rss() > 0
+
+
+@pytest.mark.unit
+class TestAccessTracker:
+    """Tests de la politique d'éviction LRU-2."""
+
+    def test_single_access_keys_evicted_first(self):
+        """Les clés accédées une seule fois sont évincées avant les clés relues."""
+        tracker = AccessTracker(k=2, shortlist_ratio=1.0)
+        tracker.record_access("hot")
+        tracker.record_access("hot")
+        for i in range(5):
+            tracker.record_access(f"scan-{i}")
+
+        victims = tracker.select_victims(5)
+
+        assert "hot" not in victims
+        assert sorted(victims) == [f"scan-{i}" for i in range(5)]
+
+    def test_forget_removes_key(self):
+        """Une clé oubliée n'est plus candidate à l'éviction."""
+        tracker = AccessTracker()
+        tracker.record_access("task")
+        tracker.forget("task")
+
+        assert "task" not in tracker
+        assert tracker.select_victims(1) == []
@@ -0,0 +1,296 @@
+"""Tests des utilitaires de compression."""
+
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+
+import pytest
+
+from scrapinium.utils.compression import (
+    AdaptiveCompressor,
+    CompressionAlgorithm,
+    compress_data,
+    compress_stream,
+    decompress_data,
+    get_best_compression,
+)
+
+
+SAMPLE_HTML = "<html><body>" + "<p>Scrapinium compression test</p>" * 200 + "</body></html>"
+
+# Prose réaliste (phrases variées, sans répétition)
+PROSE = (
+    "Scrapinium extrait le contenu des pages web, le nettoie puis le convertit "
+    "en Markdown, en texte brut ou en JSON structuré. Chaque tâche de scraping "
+    "passe par une file d'attente, un pool de navigateurs et un cache à deux "
+    "niveaux, afin que les pages déjà visitées soient resservies sans nouvel "
+    "accès réseau. Le pipeline d'apprentissage automatique classe ensuite la "
+    "page (article, produit, documentation, forum), estime la qualité du texte "
+    "et détecte les protections anti-robots les plus courantes. Les résultats "
+    "sont compressés avant stockage : le texte et le JSON profitent d'un "
+    "dictionnaire entraîné sur les contenus récents, tandis que les données "
+    "binaires passent par un codec plus rapide. Les métriques de performance, "
+    "la mémoire du processus et l'état du pool sont exposés par l'API et "
+    "affichés en temps réel dans l'interface Streamlit fournie en exemple.\n\n"
+    "Pour démarrer, installez les dépendances de production, lancez le serveur "
+    "avec uvicorn puis ouvrez la documentation interactive. Une requête POST "
+    "sur /scrape crée une tâche dont l'identifiant permet de suivre "
+    "l'avancement ; le résultat complet est disponible une fois la tâche "
+    "terminée. Les lots de plusieurs URLs sont traités en parallèle, dans la "
+    "limite du nombre de navigateurs configuré, et chaque réponse indique la "
+    "durée d'extraction ainsi que la taille du contenu obtenu.\n"
+)
+
+# Le bloc LZ4 brut n'a pas de variante incrémentale
+STREAM_ALGORITHMS = [a for a in CompressionAlgorithm if a != CompressionAlgorithm.LZ4_BLOCK]
+
+
+@pytest.mark.unit
+class TestCompressionRoundTrip:
+    """Tests de compression/décompression aller-retour."""
+
+    @pytest.mark.parametrize("algorithm", list(CompressionAlgorithm))
+    def test_text_round_trip(self, algorithm):
+        """Le texte décompressé est identique à l'original."""
+        result = compress_data(SAMPLE_HTML, algorithm)
+
+        assert result.compressed_size < result.original_size
+        restored = decompress_data(
+            result.compressed_data, algorithm, result.metadata["data_type"]
+        )
+        assert restored == SAMPLE_HTML
+
+    @pytest.mark.parametrize("algorithm", list(CompressionAlgorithm))
+    def test_dict_round_trip(self, algorithm):
+        """Les dictionnaires sont restitués à l'identique."""
+        data = {"url": "https://example.com", "content": SAMPLE_HTML, "count": 3}
+        result = compress_data(data, algorithm)
+
+        restored = decompress_data(
+            result.compressed_data, algorithm, result.metadata["data_type"]
+        )
+        assert restored == data
+
+    def test_identical_payload_hits_cache(self):
+        """Un contenu identique déjà compressé est resservi depuis le cache."""
+        data = SAMPLE_HTML + "identity-cache"
+        first = compress_data(data, CompressionAlgorithm.ZLIB)
+        second = compress_data(data, CompressionAlgorithm.ZLIB)
+
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.compressed_data == first.compressed_data
+        assert second.metadata is not first.metadata
+
+    def test_identity_cache_is_bounded_by_bytes(self, monkeypatch):
+        """Le cache d'identité ne retient pas plus que son budget en octets."""
+        import scrapinium.utils.compression as compression_module
+
+        monkeypatch.setattr(compression_module, "IDENTITY_CACHE_MAX_BYTES", 64 * 1024)
+        for i in range(16):
+            compress_data(os.urandom(16 * 1024), CompressionAlgorithm.LZ4)
+
+        cached = sum(r.compressed_size for r in compression_module._identity_cache.values())
+        assert cached == compression_module._identity_cache_bytes
+        assert cached <= 64 * 1024
+
+
+@pytest.mark.unit
+class TestBestCompression:
+    """Tests de la sélection du meilleur algorithme."""
+
+    def test_small_dict_returns_serialized_bytes(self):
+        """Les petites données non compressées sont retournées en bytes."""
+        result = get_best_compression({"a": 1})
+
+        assert result.metadata["reason"] == "too_small"
+        assert isinstance(result.compressed_data, bytes)
+        assert json.loads(result.compressed_data) == {"a": 1}
+        assert result.original_size == len(result.compressed_data)
+
+    def test_best_result_is_smallest(self):
+        """Le résultat retenu est le plus petit des algorithmes testés."""
+        best = get_best_compression(SAMPLE_HTML)
+
+        for algorithm in CompressionAlgorithm:
+            assert best.compressed_size <= compress_data(SAMPLE_HTML, algorithm).compressed_size
+        assert best.metadata["alternatives_tested"] == len(CompressionAlgorithm)
+
+    def test_incompressible_data_skips_bakeoff(self):
+        """Les données aléatoires ne sont pas comparées entre algorithmes."""
+        data = os.urandom(64 * 1024)
+        result = get_best_compression(data)
+
+        assert result.metadata["reason"] == "incompressible"
+        assert result.compressed_data == data
+
+    def test_prose_is_compressed(self):
+        """Un texte ordinaire n'est pas pris pour des données incompressibles."""
+        result = get_best_compression(PROSE)
+
+        assert "reason" not in result.metadata
+        assert result.compression_ratio < 0.7
+
+    @pytest.mark.parametrize("algorithm", [CompressionAlgorithm.GZIP, CompressionAlgorithm.ZSTD])
+    def test_large_payload_compressed_in_frames(self, algorithm):
+        """Les gros contenus sont compressés en frames parallèles décompressables d'un bloc."""
+        data = (SAMPLE_HTML * 400).encode("utf-8") + os.urandom(1024)
+        result = compress_data(data, algorithm)
+
+        assert result.metadata["frames"] > 1
+        assert decompress_data(result.compressed_data, algorithm, "bytes") == data
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Tests de la sérialisation avant compression."""
+
+    def test_list_round_trip(self):
+        """Les listes JSON-compatibles sont restituées à l'identique."""
+        data = [{"title": "Article"}, 1, "deux", None]
+        result = compress_data(data, CompressionAlgorithm.GZIP)
+
+        assert result.metadata["data_type"] == "json"
+        restored = decompress_data(
+            result.compressed_data, CompressionAlgorithm.GZIP, result.metadata["data_type"]
+        )
+        assert restored == data
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            (1, 2),
+            [datetime(2020, 1, 1)],
+            {"when": datetime(2020, 1, 1, 12, 30), "ids": (1, 2)},
+            [2**70],
+        ],
+        ids=["tuple", "datetime", "nested-datetime", "big-int"],
+    )
+    def test_exact_round_trip(self, data):
+        """Tuples, datetimes et grands entiers sont restitués sans conversion."""
+        result = compress_data(data, CompressionAlgorithm.ZLIB)
+
+        restored = decompress_data(
+            result.compressed_data, CompressionAlgorithm.ZLIB, result.metadata["data_type"]
+        )
+        assert restored == data
+        assert type(restored) is type(data)
+
+    def test_int_keys_follow_json_semantics(self):
+        """Les dict à clés int restent en JSON : les clés reviennent en str."""
+        result = compress_data({1: "x"}, CompressionAlgorithm.ZLIB)
+
+        assert result.metadata["data_type"] == "json"
+        restored = decompress_data(
+            result.compressed_data, CompressionAlgorithm.ZLIB, result.metadata["data_type"]
+        )
+        assert restored == {"1": "x"}
+
+    def test_non_json_object_round_trip(self):
+        """Les objets non JSON passent par un format binaire générique."""
+        data = {1, 2, 3}
+        result = compress_data(data, CompressionAlgorithm.ZLIB)
+
+        restored = decompress_data(
+            result.compressed_data, CompressionAlgorithm.ZLIB, result.metadata["data_type"]
+        )
+        assert restored == data
+
+
+@pytest.mark.unit
+class TestStreamCompression:
+    """Tests de la compression par flux."""
+
+    @pytest.mark.parametrize("algorithm", STREAM_ALGORITHMS)
+    def test_stream_matches_one_shot_decompression(self, algorithm):
+        """Un flux compressé se décompresse comme un appel unique."""
+        chunks = [SAMPLE_HTML[i:i + 500] for i in range(0, len(SAMPLE_HTML), 500)]
+        result = compress_stream(chunks, algorithm)
+
+        assert result.original_size == len(SAMPLE_HTML.encode("utf-8"))
+        restored = decompress_data(result.compressed_data, algorithm, result.metadata["data_type"])
+        assert restored == SAMPLE_HTML
+
+
+@pytest.mark.unit
+class TestAdaptiveCompressor:
+    """Tests du compresseur adaptatif."""
+
+    def test_text_uses_zstd(self):
+        """Le texte est compressé avec zstd par défaut."""
+        result = AdaptiveCompressor().compress_adaptive(SAMPLE_HTML)
+        assert result.algorithm == CompressionAlgorithm.ZSTD
+
+    def test_binary_uses_lz4(self):
+        """Les bytes bruts passent par LZ4."""
+        result = AdaptiveCompressor().compress_adaptive(SAMPLE_HTML.encode("utf-8"))
+        assert result.algorithm == CompressionAlgorithm.LZ4
+
+    def test_prefer_speed_uses_lz4_block(self):
+        """La préférence vitesse force le bloc LZ4 brut."""
+        result = AdaptiveCompressor().compress_adaptive(SAMPLE_HTML, prefer_speed=True)
+        assert result.algorithm == CompressionAlgorithm.LZ4_BLOCK
+
+    def test_prefer_size_is_not_overridden_by_probe(self):
+        """La préférence taille impose Brotli, même sur un texte court et varié."""
+        result = AdaptiveCompressor().compress_adaptive(PROSE, prefer_size=True)
+
+        assert result.algorithm == CompressionAlgorithm.BROTLI
+        assert result.compression_ratio < 0.6
+
+    def test_avg_time_is_running_mean(self, monkeypatch):
+        """Le temps moyen est la moyenne exacte des compressions."""
+        import scrapinium.utils.compression as compression_module
+
+        ticks = iter([0, 10_000_000, 0, 30_000_000, 0, 20_000_000])  # 10ms, 30ms, 20ms
+        monkeypatch.setattr(compression_module.time, "perf_counter_ns", lambda: next(ticks))
+
+        compressor = AdaptiveCompressor()
+        data = SAMPLE_HTML + "running-mean"
+        for _ in range(3):
+            compressor.compress_adaptive(data)
+
+        stats = compressor.compression_stats[CompressionAlgorithm.ZSTD.value]
+        assert stats["uses"] == 3
+        assert stats["avg_time_ms"] == pytest.approx(20.0)
+        assert stats["p95_time_ms"] == pytest.approx(30.0)
+        assert stats["cache_hits"] == 2
+
+    def test_trained_zstd_dictionary_round_trip(self, monkeypatch, tmp_path):
+        """Après entraînement, les petits contenus utilisent le dictionnaire zstd."""
+        import scrapinium.utils.compression as compression_module
+
+        monkeypatch.setattr(compression_module, "ZSTD_RETRAIN_INTERVAL", 300)
+        monkeypatch.setattr(compression_module, "ZSTD_DICT_DIR", tmp_path)
+        compressor = AdaptiveCompressor()
+        pages = [
+            f"<html><head><title>Page {i}</title></head><body><nav>Accueil | Articles</nav>"
+            f"<article id='{i}'>{'<p>Contenu %d</p>' % (i * 7) * (i % 13 + 1)}</article>"
+            f"<footer>Scrapinium {i}</footer></body></html>"
+            for i in range(300)
+        ]
+        for page in pages:
+            compressor.compress_adaptive(page)
+        compressor._zstd_training.result()
+
+        compressor.compress_adaptive(pages[0])  # Installe le dictionnaire
+        result = compressor.compress_adaptive(pages[42])
+
+        assert "zstd_dict_id" in result.metadata
+        restored = decompress_data(
+            result.compressed_data, result.algorithm, result.metadata["data_type"]
+        )
+        assert restored == pages[42]
+
+        # Seul l'identifiant voyage avec le payload (métadonnées sérialisables)
+        assert "zstd_dict" not in result.metadata
+        json.dumps(result.to_dict())
+
+        # Après un redémarrage, le registre persistant fournit le dictionnaire
+        monkeypatch.setattr(compression_module, "_zstd_dictionaries", OrderedDict())
+        restored = decompress_data(
+            result.compressed_data, result.algorithm, result.metadata["data_type"]
+        )
+        assert restored == pages[42]
+        assert (tmp_path / f"{result.metadata['zstd_dict_id']}.zdict").exists()
@@ -0,0 +1,65 @@
+"""Tests des fonctions utilitaires générales."""
+
+import pytest
+
+from scrapinium.utils.helpers import (
+    calculate_file_size,
+    extract_domain,
+    format_file_size,
+    hash_url,
+)
+
+
+@pytest.mark.unit
+class TestHashUrl:
+    """Tests du hachage des URLs."""
+
+    def test_hash_is_stable_and_fixed_length(self):
+        """Le hash est déterministe et garde une longueur de 32 caractères."""
+        url = "https://example.com/article?id=1"
+
+        assert hash_url(url) == hash_url(url)
+        assert len(hash_url(url)) == 32
+
+    def test_distinct_urls_have_distinct_hashes(self):
+        """Deux URLs différentes produisent des hashes différents."""
+        assert hash_url("https://example.com/a") != hash_url("https://example.com/b")
+
+
+@pytest.mark.unit
+class TestFileSize:
+    """Tests du calcul et du formatage des tailles."""
+
+    @pytest.mark.parametrize("content", ["", "hello", "café", "日本語", "emoji 🚀"])
+    def test_size_matches_utf8_length(self, content):
+        """La taille calculée correspond à l'encodage UTF-8."""
+        assert calculate_file_size(content) == len(content.encode("utf-8"))
+
+    @pytest.mark.parametrize(
+        "size,expected",
+        [
+            (0, "0 B"),
+            (1023, "1023 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (5 * 1024**2, "5.0 MB"),
+            (3 * 1024**3, "3.0 GB"),
+            (2 * 1024**4, "2.0 TB"),
+        ],
+    )
+    def test_format_file_size(self, size, expected):
+        """Chaque taille est affichée dans l'unité adaptée."""
+        assert format_file_size(size) == expected
+
+
+@pytest.mark.unit
+class TestExtractDomain:
+    """Tests de l'extraction de domaine."""
+
+    def test_extracts_netloc(self):
+        """Le domaine (avec port) est extrait de l'URL."""
+        assert extract_domain("https://example.com:8080/path?q=1") == "example.com:8080"
+
+    def test_invalid_url_returns_none(self):
+        """Une URL mal formée retourne None."""
+        assert extract_domain("http://[::1") is None
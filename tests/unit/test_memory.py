@@ -0,0 +1,183 @@
+"""Tests du moniteur mémoire."""
+
+import time
+
+import pytest
+
+from scrapinium.utils.memory import MemoryMonitor, MemorySnapshot, detect_allocator
+
+
+def _snapshot(memory_mb: float) -> MemorySnapshot:
+    """Crée un snapshot factice."""
+    return MemorySnapshot(
+        timestamp=None,
+        process_memory_mb=memory_mb,
+        system_memory_percent=50.0,
+        gc_objects=0,
+        active_coroutines=0,
+    )
+
+
+@pytest.mark.unit
+class TestMemorySnapshots:
+    """Tests de l'historique des snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        """L'historique ne dépasse pas max_snapshots."""
+        monitor = MemoryMonitor(max_snapshots=3)
+        for _ in range(5):
+            await monitor.take_snapshot()
+
+        assert len(monitor.stats.snapshots) == 3
+
+    @pytest.mark.asyncio
+    async def test_average_covers_retained_snapshots(self, monkeypatch):
+        """La moyenne ne porte que sur les snapshots conservés."""
+        monitor = MemoryMonitor(max_snapshots=3)
+        values = iter([10.0, 20.0, 30.0, 40.0, 50.0])
+        monkeypatch.setattr(monitor, "get_current_usage", lambda: _snapshot(next(values)))
+
+        for _ in range(5):
+            await monitor.take_snapshot()
+
+        assert monitor.stats.average_usage_mb == pytest.approx(40.0)
+        assert monitor.stats.peak_usage_mb == 50.0
+
+    @pytest.mark.asyncio
+    async def test_force_gc_reports_collected_cycles(self):
+        """force_gc retourne le nombre d'objets inaccessibles collectés."""
+        monitor = MemoryMonitor()
+
+        class _Node:
+            pass
+
+        for _ in range(10):
+            node = _Node()
+            node.self_ref = node
+        del node
+
+        assert await monitor.force_gc() >= 10
+        assert monitor.stats.gc_collections == 1
+
+    @pytest.mark.asyncio
+    async def test_force_gc_is_rate_limited(self, monkeypatch):
+        """Les GC forcés rapprochés ne s'empilent pas."""
+        import scrapinium.utils.memory as memory_module
+
+        clock = [1000.0]
+        monkeypatch.setattr(memory_module.time, "monotonic", lambda: clock[0])
+        monitor = MemoryMonitor(min_gc_interval=5.0)
+
+        await monitor.force_gc()
+        clock[0] += 1.0
+        assert await monitor.force_gc() == 0
+        assert monitor.stats.gc_collections == 1
+
+        await monitor.force_gc(force=True)
+        clock[0] += 10.0
+        await monitor.force_gc()
+        assert monitor.stats.gc_collections == 3
+
+    @pytest.mark.asyncio
+    async def test_emergency_cleanup_bypasses_rate_limit(self, monkeypatch):
+        """Le nettoyage d'urgence collecte même juste après un GC préventif."""
+        import scrapinium.utils.memory as memory_module
+
+        clock = [1000.0]
+        monkeypatch.setattr(memory_module.time, "monotonic", lambda: clock[0])
+        monitor = MemoryMonitor(min_gc_interval=5.0)
+
+        await monitor.force_gc()  # GC préventif du callback warning
+        await monitor.emergency_cleanup()
+
+        # GC agressif + optimisation complète, malgré la limite de fréquence
+        assert monitor.stats.gc_collections == 3
+
+    def test_current_usage_outside_event_loop(self):
+        """Un snapshot peut être pris hors d'une boucle asyncio."""
+        snapshot = MemoryMonitor().get_current_usage()
+
+        assert snapshot.active_coroutines == 0
+        assert snapshot.process_memory_mb > 0
+
+    def test_snapshot_timestamp_defaults_to_now(self):
+        """Le timestamp par défaut est l'heure de création."""
+        before = time.time()
+        snapshot = _snapshot(1.0)
+
+        assert before <= snapshot.timestamp <= time.time()
+
+    def test_snapshot_keeps_positional_order(self):
+        """timestamp reste le premier champ et 0.0 n'est pas écrasé."""
+        snapshot = MemorySnapshot(0.0, 12.5, 40.0, 3, 1)
+
+        assert snapshot.timestamp == 0.0
+        assert snapshot.process_memory_mb == 12.5
+        assert snapshot.active_coroutines == 1
+
+    def test_allocation_tracing_is_opt_in(self):
+        """tracemalloc n'est actif qu'à la demande."""
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc déjà actif dans ce processus")
+
+        monitor = MemoryMonitor()
+        assert not tracemalloc.is_tracing()
+
+        monitor.enable_allocation_tracing()
+        assert tracemalloc.is_tracing()
+        monitor.disable_allocation_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_recent_snapshots_keeps_order(self):
+        """Les derniers snapshots sont retournés du plus ancien au plus récent."""
+        monitor = MemoryMonitor(max_snapshots=5)
+        for value in range(8):
+            monitor.stats.snapshots.append(_snapshot(float(value)))
+
+        recent = monitor.stats.recent_snapshots(3)
+
+        assert [s.process_memory_mb for s in recent] == [5.0, 6.0, 7.0]
+
+    def test_usage_trend_uses_last_five(self):
+        """La tendance compare les 5 derniers snapshots."""
+        monitor = MemoryMonitor()
+        for value in (500.0, 100.0, 100.0, 100.0, 100.0, 150.0):
+            monitor.stats.snapshots.append(_snapshot(value))
+
+        assert monitor.stats.usage_trend == "increasing"
+
+    @pytest.mark.asyncio
+    async def test_report_trends_follow_new_snapshots(self, monkeypatch):
+        """Les tendances du rapport sont recalculées après chaque snapshot."""
+        monitor = MemoryMonitor()
+        current = [100.0]
+        monkeypatch.setattr(monitor, "get_current_usage", lambda: _snapshot(current[0]))
+
+        await monitor.take_snapshot()
+        current[0] = 120.0
+        await monitor.take_snapshot()
+        assert monitor.get_memory_report()["trends"]["max_recent"] == 120.0
+        assert monitor.get_memory_report()["trends"]["max_recent"] == 120.0
+
+        current[0] = 180.0
+        await monitor.take_snapshot()
+        trends = monitor.get_memory_report()["trends"]
+        assert trends["max_recent"] == 180.0
+        assert trends["direction"] == "increasing"
+
+
+@pytest.mark.unit
+class TestAllocatorDetection:
+    """Tests de la détection de l'allocateur mémoire."""
+
+    def test_preloaded_allocator_is_reported(self, monkeypatch):
+        """Un allocateur chargé via LD_PRELOAD apparaît dans le rapport."""
+        monkeypatch.setenv("LD_PRELOAD", "/usr/lib/x86_64-linux-gnu/libmimalloc.so.2")
+        detect_allocator.cache_clear()
+        try:
+            assert MemoryMonitor().get_memory_report()["allocator"] == "mimalloc"
+        finally:
+            detect_allocator.cache_clear()
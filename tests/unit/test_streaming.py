@@ -0,0 +1,208 @@
+"""Tests du traitement en streaming."""
+
+import gzip
+import json
+
+import pytest
+
+from scrapinium.utils.streaming import (
+    ContentStreamer,
+    MemoryEfficientProcessor,
+    StreamingProcessor,
+)
+
+
+SAMPLE_HTML = (
+    "<html><body>"
+    + "".join(f"<p>Paragraphe {i}</p><a href='/page/{i}'>Lien {i}</a>" for i in range(50))
+    + "</body></html>"
+)
+
+
+@pytest.mark.unit
+class TestLargeHtmlProcessing:
+    """Tests du traitement des HTML volumineux."""
+
+    @pytest.mark.asyncio
+    async def test_text_and_links_extracted(self):
+        """Le texte et les liens sont extraits du HTML."""
+        result = await MemoryEfficientProcessor().process_large_html(SAMPLE_HTML)
+
+        assert "Paragraphe 0" in result["text_content"]
+        assert "Paragraphe 49" in result["text_content"]
+        assert len(result["links"]) == 50
+        assert result["links"][0] == {"href": "/page/0", "text": "Lien 0"}
+
+    @pytest.mark.asyncio
+    async def test_links_limited_to_100(self):
+        """Au plus 100 liens sont extraits, dans l'ordre du document."""
+        html = "<div>" + "".join(f"<p><a href='/{i}'>L{i}</a></p>" for i in range(150)) + "</div>"
+        result = await MemoryEfficientProcessor().process_large_html(html, extract_text=False)
+
+        assert len(result["links"]) == 100
+        assert result["links"][-1]["href"] == "/99"
+
+    @pytest.mark.asyncio
+    async def test_document_without_elements_has_no_links(self):
+        """Un HTML sans élément ne produit aucun lien (pas de repli sur le HTML brut)."""
+        result = await MemoryEfficientProcessor().process_large_html("<!-- c -->")
+
+        assert result["links"] == []
+        assert result["text_content"] != "<!-- c -->"
+
+    @pytest.mark.asyncio
+    async def test_text_size_is_capped(self):
+        """Le texte extrait s'arrête à la moitié de la taille maximale."""
+        html = "<html><body>" + ("<p>" + "x" * 1000 + "</p>") * 100 + "</body></html>"
+        result = await MemoryEfficientProcessor().process_large_html(
+            html, extract_links=False, max_content_size=len(html)
+        )
+
+        # Arrêt au premier chunk de 32KB qui dépasse la moitié du contenu
+        assert 50 * 1024 < len(result["text_content"]) < 70 * 1024
+
+
+@pytest.mark.unit
+class TestStreamingProcessor:
+    """Tests du découpage en chunks et de l'extraction de texte."""
+
+    @pytest.mark.asyncio
+    async def test_text_split_across_chunks_is_intact(self):
+        """Les balises et caractères coupés entre deux chunks restent intacts."""
+        processor = StreamingProcessor(chunk_size=7)
+        html = (
+            "<html><head><script>var x = 1;</script></head>"
+            "<body><p>Héllo wörld</p><p>Deuxième paragraphe</p></body></html>"
+        )
+
+        text = " ".join([t async for t in processor.extract_text_streaming(html)])
+
+        assert text == "Héllo wörld Deuxième paragraphe"
+
+    @pytest.mark.asyncio
+    async def test_bs4_fallback_keeps_split_characters(self):
+        """Le repli BeautifulSoup réassemble les caractères UTF-8 coupés."""
+        processor = StreamingProcessor(chunk_size=4)
+
+        text = "".join([t async for t in processor._extract_text_bs4("ééééé", 1024)])
+
+        assert text == "ééééé"
+
+    @pytest.mark.asyncio
+    async def test_chunks_cover_content(self):
+        """Les chunks recomposent exactement le contenu."""
+        processor = StreamingProcessor(chunk_size=100)
+        content = "Hello World! " * 50
+
+        chunks = [chunk async for chunk in processor.process_content_stream(content)]
+
+        assert b"".join(chunk.data for chunk in chunks) == content.encode("utf-8")
+        assert all(type(chunk.data) is bytes for chunk in chunks)
+        assert chunks[-1].is_final
+        assert not any(chunk.is_final for chunk in chunks[:-1])
+        assert all(chunk.metadata is None for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_held_chunks_are_not_recycled(self):
+        """Les chunks conservés par l'appelant ne sont jamais réutilisés."""
+        processor = StreamingProcessor(chunk_size=10)
+
+        first = [c async for c in processor.process_content_stream(b"a" * 30)]
+        [t async for t in processor.extract_text_streaming("<p>" + "b" * 50 + "</p>")]
+        second = [c async for c in processor.process_content_stream(b"c" * 30)]
+
+        assert b"".join(c.data for c in first) == b"a" * 30
+        assert b"".join(c.data for c in second) == b"c" * 30
+        assert not {id(c) for c in first} & {id(c) for c in second}
+
+    @pytest.mark.asyncio
+    async def test_metadata_on_request(self):
+        """La progression n'est jointe que sur demande."""
+        processor = StreamingProcessor(chunk_size=100)
+
+        chunks = [
+            chunk async for chunk in processor.process_content_stream(
+                b"x" * 250, include_metadata=True
+            )
+        ]
+
+        assert [c.metadata["bytes_processed"] for c in chunks] == [100, 200, 250]
+        assert chunks[-1].metadata["progress"] == 1.0
+
+
+@pytest.mark.unit
+class TestContentStreamer:
+    """Tests du streaming de contenu compressé."""
+
+    @pytest.mark.asyncio
+    async def test_compressed_stream_is_valid_gzip(self):
+        """Le flux compressé se décompresse en un seul appel gzip."""
+        content = SAMPLE_HTML * 50
+        streamer = ContentStreamer()
+
+        chunks = [chunk async for chunk in streamer.stream_large_content(content)]
+
+        assert gzip.decompress(b"".join(chunks)) == content.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_stream_to_file(self, tmp_path):
+        """Le flux écrit sur disque est identique au contenu compressé."""
+        content = SAMPLE_HTML * 50
+        streamer = ContentStreamer()
+        target = tmp_path / "out.gz"
+
+        written = await streamer.stream_to_file(
+            streamer.stream_large_content(content), str(target)
+        )
+
+        assert written == target.stat().st_size
+        assert gzip.decompress(target.read_bytes()) == content.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_json_content_round_trip(self):
+        """Les dictionnaires sont sérialisés en JSON UTF-8."""
+        content = {"titre": "Été", "valeurs": [1, 2, 2**70]}
+        streamer = ContentStreamer(enable_compression=False)
+
+        chunks = [
+            chunk async for chunk in streamer.stream_large_content(content, content_type="json")
+        ]
+
+        assert json.loads(b"".join(chunks)) == content
+
+    @pytest.mark.asyncio
+    async def test_small_content_not_compressed(self):
+        """Les contenus de moins de 1KB sont transmis tels quels."""
+        streamer = ContentStreamer()
+
+        chunks = [chunk async for chunk in streamer.stream_large_content("court")]
+
+        assert b"".join(chunks) == b"court"
+
+
+@pytest.mark.unit
+class TestCompressAndStore:
+    """Tests de la compression avant stockage."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repeat", [100, 20000])
+    async def test_large_and_small_payloads_compressed(self, repeat):
+        """Petits et gros contenus (compressés hors boucle) donnent le même format."""
+        info = await MemoryEfficientProcessor().compress_and_store(
+            {"content": "Scrapinium " * repeat}, "key"
+        )
+
+        assert info["compressed"]
+        assert info["compressed_size"] < info["original_size"]
+        assert info["codec"] == "zstd"
+
+    @pytest.mark.asyncio
+    async def test_already_compressed_payload_is_stored_as_is(self):
+        """Un contenu déjà gzippé n'est pas recompressé."""
+        payload = gzip.compress(b"Scrapinium " * 2000)
+
+        info = await MemoryEfficientProcessor().compress_and_store(payload, "key")
+
+        assert info["codec"] == "none"
+        assert not info["compressed"]
+        assert info["compressed_size"] == len(payload)
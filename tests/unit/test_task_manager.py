@@ -0,0 +1,69 @@
+"""Tests du gestionnaire de tâches."""
+
+import pytest
+
+from scrapinium.utils.cleanup import CleanupRule, ResourceType
+
+try:
+    from scrapinium.api.task_manager import TaskManager
+    TASK_MANAGER_AVAILABLE = True
+except ImportError:
+    TASK_MANAGER_AVAILABLE = False
+
+
+def _complete(manager, task_id):
+    """Ajoute puis termine une tâche."""
+    manager.add_task(task_id, {"id": task_id})
+    manager.complete_task(task_id, {"result": task_id})
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not TASK_MANAGER_AVAILABLE, reason="Module API non disponible")
+class TestCompletedTasksEviction:
+    """Tests de la rétention des tâches terminées."""
+
+    def test_cleanup_callback_keeps_manager_retention(self):
+        """La règle TASKS n'abaisse pas la rétention au seuil de la règle."""
+        manager = TaskManager()
+        for i in range(150):
+            _complete(manager, f"task-{i}")
+
+        rule = CleanupRule(
+            resource_type=ResourceType.TASKS,
+            condition="count",
+            threshold=100,
+            action="archive",
+        )
+        result = manager.cleanup_callback(rule)
+
+        assert result["items_cleaned"] == 0
+        assert len(manager.get_completed_tasks()) == 150
+        assert manager.find_completed_task("task-0") is not None
+
+    def test_overflow_evicts_single_access_tasks_first(self):
+        """Au-delà de la limite, les tâches relues survivent aux accès ponctuels."""
+        manager = TaskManager()
+        manager._max_completed_tasks = 10
+        _complete(manager, "hot")
+        manager.mark_result_read("hot")
+        for i in range(10):
+            _complete(manager, f"scan-{i}")
+
+        assert len(manager.get_completed_tasks()) == 10
+        assert manager.find_completed_task("hot") is not None
+        assert manager.find_completed_task("scan-0") is None
+
+    def test_status_lookups_do_not_count_as_access(self):
+        """Consulter le statut d'une tâche ne la protège pas de l'éviction."""
+        manager = TaskManager()
+        manager._max_completed_tasks = 2
+        _complete(manager, "polled")
+        _complete(manager, "read")
+        for _ in range(3):
+            manager.find_completed_task("polled")
+        manager.mark_result_read("read")
+
+        _complete(manager, "new")
+
+        assert manager.find_completed_task("polled") is None
+        assert manager.find_completed_task("read") is not None